@@ -23,7 +23,24 @@
 import re
 import sys
 
-from copy import copy
+# Pattern used to look for template variables (i.e., names in between {{...}}).
+# Any whitespaces between the variable name and the curly brackets are ignored.
+# Compiled only once as it is matched against every leaf node of the YAML data.
+TEMPLATE_VARIABLE_REGEX = re.compile(r'\{\{\s*([A-Z_]+)\s*\}\}')
+
+# Types of the leaf nodes of the YAML data (i.e., all nodes that are not of type "list" or "dict").
+LEAF_TYPES = (bool, float, int, str)
+
+# Marker for template variables that were never set.
+# Needed since template variables may be legitimately set to empty (null) values.
+UNDEFINED = object()
+
+# Name of the template variable holding the "ros_metadata" of a robot for each ROS version.
+# For ROS1 robots it holds the port of the master node while for ROS2 robots it holds the domain.
+ROS_METADATA_VARIABLES = {
+    'ROS1': 'ROBOT_ROS_PORT',
+    'ROS2': 'ROBOT_ROS_DOMAIN'
+}
 
 
 class Decoder():
@@ -63,16 +80,6 @@ class Decoder():
         placeholder for all decoded entities of type "Robot" referenced by their unique "id".
     """
 
-    areas = {}
-    global_images = {}
-    images = {}
-    packages = {}
-    robots = {}
-
-    # The mapping between template variable names and their value.
-    # This structure is the one responsible for the atual decoding of template variables.
-    __decoder_variables = {}
-
     def __init__(self, areas, robots, images, packages, global_images):
         """
         Parameters
@@ -99,6 +106,14 @@ class Decoder():
         self.packages = packages
         self.global_images = global_images
 
+        # The mapping between template variable names (without curly brackets) and their value.
+        # This structure is the one responsible for the atual decoding of template variables.
+        self.__decoder_variables = {}
+
+        # The mapping between already decoded samples of data and their decoded value.
+        # Only valid while the template variables in "__decoder_variables" remain unchanged.
+        self.__decoded_cache = {}
+
         # Trigger the decoding of all loaded entities.
         self.__decode()
 
@@ -120,77 +135,85 @@ class Decoder():
             the provided sample of data decoded.
         """
 
-        decoded = data
-
-        # Make sure no whitespaces exist between variable name and curly brackets.
-        # TODO: remove automatically as many spaces as required. Assuming at most only one whitespace.
-        decoded = decoded.replace("{{ ", "{{")
-        decoded = decoded.replace(" }}", "}}")
-
-        # Look for all template variables in between {{...}}.
-        matches = re.findall("{{[A-Z_]+}}", decoded)
-        for match in matches:
-            try:
-                # Substitute template variables by their current value.
-                decoded = decoded.replace(
-                    match,
-                    str(self.__decoder_variables[match])
-                )
-            except KeyError:  # an unspecified template variable was found.
-                print(f'Invalid template variable "{match}" found while decoding an instance')
-                sys.exit(1)
+        # Most samples of data contain no template variables at all and can be returned as they are.
+        if '{{' not in data:
+            return data
 
+        # Reuse the decoded value if the same sample of data was already decoded.
+        if data in self.__decoded_cache:
+            return self.__decoded_cache[data]
+
+        # Look for all template variables in between {{...}} and substitute them in a single pass.
+        decoded = TEMPLATE_VARIABLE_REGEX.sub(self.__decode_template_variable, data)
+        self.__decoded_cache[data] = decoded
         return decoded
 
-    def __traverse_yaml_data(self, yaml_data):
-        """Traverse the entire YAML data of an entity and substitute all existent template variables.
+    def __decode_template_variable(self, match):
+        """Decodes a single template variable found within a sample of data.
 
         Parameters
         ----------
-        yaml_data : dict
-            The complete YAML data of a given loaded entity.
+        match : re.Match
+            The match of the template variable to decode.
+
+        Returns
+        -------
+        str
+            the current value of the template variable.
         """
 
-        # NOTE: The traversal of the YAML data is done recursively by the auxiliar function __traverse_yaml_data_aux.
-        # This function works as a wrapper for that function simplifying the passing of arguments.
-        # Therefore make sure to always call this function instead of the auxiliary one.
-        self.__traverse_yaml_data_aux(yaml_data, yaml_data)
+        variable = match.group(1)
+        value = self.__decoder_variables.get(variable, UNDEFINED)
+        if value is UNDEFINED:  # an unspecified template variable was found.
+            print('Invalid template variable "{{' + variable + '}}" found while decoding an instance')
+            sys.exit(1)
 
-    def __traverse_yaml_data_aux(self, complete_yaml_data, yaml_data, path=''):
-        """Recursive funtion to traverse the entire YAML data of an entity and substitute all existent template variables.
+        # Substitute template variables by their current value.
+        return str(value)
 
-        This function is an auxiliary function to "__traverse_yaml_data" and should never be called directly.
+    def __traverse_yaml_data(self, yaml_data):
+        """Traverse the entire YAML data of an entity and substitute all existent template variables.
 
         Parameters
         ----------
-        complete_yaml_data : dict
-            The complete YAML data of a given loaded entity.
-
         yaml_data : dict
-            The part of YAML data of a given loaded entity that is being decoded in the current recursive step.
-
-        path : str
-            An accumulator variable (default='').
+            The complete YAML data of a given loaded entity.
         """
 
-        type_data = type(yaml_data)
-
-        # Case base - a leaf node has been reached and its data must be decoded.
-        # Leaf nodes are all nodes that are not of type "list" or "dict".
-        if type_data in [bool, float, int, str]:
-            decoded_leaf_node = self.__substitute_template_variable(str(yaml_data))  # noqa: F841
-            exec(f'complete_yaml_data{path} = decoded_leaf_node')
-
-        elif type_data in [list]:  # "list"
-            for i in range(len(yaml_data)):
-                self.__traverse_yaml_data_aux(complete_yaml_data, yaml_data[i], path + f"[{i}]")
-
-        else:  # "dict"
-            for field, field_value in yaml_data.items():
-                # The field 'vars' contains definitions of template variables that are to be passed
-                # between entities and therefore must not be decoded within the same level they are declared.
-                if field not in ['vars']:
-                    self.__traverse_yaml_data_aux(complete_yaml_data, field_value, path + f"['{field}']")
+        # NOTE: The traversal of the YAML data is done iteratively using an explicit stack.
+        # Each entry of the stack holds a node of the YAML data, the container holding that node and
+        # the field (or index) of the node within that container (i.e., it always holds that "parent[key] is value").
+        # The traversal is bound by the interpreter itself (i.e., attribute lookups and calls) and not by memory.
+        # Therefore all methods used for every node are bound once to local names before the loop.
+        # The YAML data of an entity is owned by that entity but nested lists and dictionaries may still be shared
+        # with other entities declared from the same YAML data (e.g., a same image used by several robots).
+        # Therefore nested nodes are always decoded into a copy that replaces the original one.
+        stack = [(yaml_data, field, value) for field, value in yaml_data.items() if field not in ['vars']]
+        pop = stack.pop
+        push = stack.append
+        substitute = self.__substitute_template_variable
+        while stack:
+            parent, key, value = pop()
+
+            # A leaf node has been reached and its data must be decoded.
+            # Leaf nodes are all nodes that are not of type "list" or "dict".
+            # Decoded data is stored directly in the container holding the leaf node.
+            # Most leaf nodes are already strings and do not require any conversion.
+            if isinstance(value, LEAF_TYPES):
+                parent[key] = substitute(value if type(value) is str else str(value))
+
+            elif isinstance(value, list):
+                value = parent[key] = list(value)
+                for i, entry in enumerate(value):
+                    push((value, i, entry))
+
+            elif isinstance(value, dict):
+                value = parent[key] = dict(value)
+                for field, field_value in value.items():
+                    # The field 'vars' contains definitions of template variables that are to be passed
+                    # between entities and therefore must not be decoded within the same level they are declared.
+                    if field not in ['vars']:
+                        push((value, field, field_value))
 
     def __decode_area(self, area):
         """Decode the YAML data of a single entity of type "Area".
@@ -205,9 +228,10 @@ class Decoder():
         # Therefere, whenever the YAML data of a new entity of type "Area" starts being decoded it
         # is crucial to clear all information regarding previous decodings.
         self.__decoder_variables = {}
+        self.__decoded_cache = {}
 
         # Set the global tempalte variables to be passed to all other entities.
-        self.__decoder_variables['{{AREA_ID}}'] = area.id
+        self.__decoder_variables['AREA_ID'] = area.id
 
         # Trigger the decoding of the robots within the area.
         self.areas[area.id] = area
@@ -225,49 +249,37 @@ class Decoder():
             The entity of type "Robot" to be decoded.
         """
 
-        # Make sure to use make a copy of the "robot" instance
-        # so that the same base information may be used in decoding multiple
-        # instances of type "package" and "image".
-        __robot = copy(robot)
-
-        self.__traverse_yaml_data(__robot.yaml_data)
-        self.robots[__robot.id] = __robot
+        # Each entity of type "Robot" is declared within a single area and is thus decoded only once.
+        # Therefore its YAML data can be safely decoded in place.
+        self.__traverse_yaml_data(robot.yaml_data)
+        self.robots[robot.id] = robot
 
         # Set the global template variables to be passed to instances of type "package" and "image".
-        self.__decoder_variables['{{ROBOT_ID}}'] = __robot.id
-        self.__decoder_variables['{{ROBOT_ROS_DISTRO}}'] = __robot.yaml_data['ros_distro']
-        if __robot.yaml_data['ros_version'] == 'ROS1':
-            self.__decoder_variables['{{ROBOT_ROS_PORT}}'] = __robot.yaml_data['ros_metadata']
-        else:
-            self.__decoder_variables['{{ROBOT_ROS_DOMAIN}}'] = __robot.yaml_data['ros_metadata']
+        self.__decoder_variables['ROBOT_ID'] = robot.id
+        self.__decoder_variables['ROBOT_ROS_DISTRO'] = robot.yaml_data['ros_distro']
+        ros_metadata_variable = ROS_METADATA_VARIABLES[robot.yaml_data['ros_version']]
+        self.__decoder_variables[ros_metadata_variable] = robot.yaml_data['ros_metadata']
 
         # Set the custom template variables to be passed to instances of type "package" and "image".
-        if 'vars' in __robot.yaml_data:
-            for entry in __robot.yaml_data['vars']:
+        if 'vars' in robot.yaml_data:
+            for entry in robot.yaml_data['vars']:
                 for var, value in entry.items():
-                    self.__decoder_variables['{{' + var + '}}'] = value
+                    self.__decoder_variables[var] = value
+
+        # Template variables were (re)set and therefore previously decoded values may no longer be valid.
+        self.__decoded_cache = {}
 
         # Trigger decoding of entities of type "image" associated with the robot.
-        if 'images' in __robot.yaml_data:
-            for image_id in __robot.yaml_data['images']:
-                try:
-                    image = self.images[image_id]
-                    self.__decode_image(image)
-                except KeyError:
-                    # TODO: pass this verification step to the first stage of the pipeline.
-                    print(f'Image "{image_id}" was listed but not declared.')
-                    sys.exit(1)
+        # NOTE: all listed images were already ensured to be declared (see "EntityLoader").
+        if 'images' in robot.yaml_data:
+            for image_id in robot.yaml_data['images']:
+                self.__decode_image(self.images[image_id])
 
         # Trigger decoding of entities of type "package" associated with the robot.
-        if 'packages' in __robot.yaml_data:
-            for package_id in __robot.yaml_data['packages']:
-                try:
-                    package = self.packages[package_id]
-                    self.__decode_package(package)
-                except KeyError:
-                    # TODO: pass this verification step to the first stage of the pipeline.
-                    print(f'Image "{image_id}" was listed but not declared.')
-                    sys.exit(1)
+        # NOTE: all listed packages were already ensured to be declared (see "EntityLoader").
+        if 'packages' in robot.yaml_data:
+            for package_id in robot.yaml_data['packages']:
+                self.__decode_package(self.packages[package_id])
 
     def __decode_image(self, image, is_global=False):
         """Decode the YAML data of a single entity of type "Image".
@@ -278,14 +290,10 @@ class Decoder():
             The entity of type "Image" to be decoded.
         """
 
-        # Make sure to use make a copy of the original "image" instance
-        # so that the same base information may be used in decoding multiple instances.
-        __image = copy(image)
-
-        # Decode all template variables.
-        self.__traverse_yaml_data(__image.yaml_data)
-
-        self.images[__image.id] = __image
+        # Each entity of type "Image" is unique to the robot declaring it and is thus decoded only once.
+        # Therefore its YAML data can be safely decoded in place.
+        self.__traverse_yaml_data(image.yaml_data)
+        self.images[image.id] = image
 
     def __decode_package(self, package):
         """Decode the YAML data of a single entity of type "Package".
@@ -296,13 +304,10 @@ class Decoder():
             The entity of type "Package" to be decoded.
         """
 
-        # Make sure to use make a copy of the original "package" instance
-        # so that the same base information may be used in decoding multiple instances.
-        __package = copy(package)
-
-        # Replace all template variables
-        self.__traverse_yaml_data(__package.yaml_data)
-        self.packages[__package.id] = __package
+        # Each entity of type "Package" is unique to the robot declaring it and is thus decoded only once.
+        # Therefore its YAML data can be safely decoded in place.
+        self.__traverse_yaml_data(package.yaml_data)
+        self.packages[package.id] = package
 
     def __decode(self):
         """Decode the YAML data of all loaded entities.
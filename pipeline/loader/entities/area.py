@@ -43,11 +43,15 @@ class Area:
         the complete YAML data for the entity obtained from the input configuration file.
     """
 
+    __slots__ = ('id', 'yaml_data')
+
     # WARNING: if adding more required fields ensure that field "id" is always the first.
     required_fields = ['id', 'robots']
+    _required_fields = frozenset(required_fields)
 
-    def __parse_yaml_data(self, yaml_data):
-        """Parses the YAML data for a given entity of type "Area".
+    @staticmethod
+    def _validate(yaml_data):
+        """Validates the YAML data for a given entity of type "Area".
 
         In order to be considered valid, the passed YAML data must contain a non-empty entry for each required field.
         Besides that a verification is done to ensure that:
@@ -58,40 +62,64 @@ class Area:
         ----------
         yaml_data : dict
             The complete YAML data for the entity obtained from the input configuration file.
+
+        Returns
+        -------
+        str
+            the error message describing why the data is invalid (None if the data is valid).
         """
 
         # Ensure the provided YAML data is not empty.
         if not len(yaml_data):
-            print('An area was declared with empty data')
-            sys.exit(1)
+            return 'An area was declared with empty data'
 
         # Ensure the provided YAML data contains all the required fields.
-        for field in self.required_fields:
+        missing_fields = Area._required_fields.difference(yaml_data)
+        if missing_fields:
+            return '\n'.join(
+                f'An area was declared without required field "{field}"'
+                for field in Area.required_fields if field in missing_fields
+            )
 
-            if field not in yaml_data:
-                print(f'An area was declared without required field "{field}"')
-                sys.exit(1)
+        for field in Area.required_fields:
 
-            elif field == 'id':
+            if field == 'id':
                 # Ensure provided id is not empty.
                 if not yaml_data['id']:
-                    print('An area was declared with an empty "id"')
-                    sys.exit(1)
-                self.id = yaml_data['id']
+                    return 'An area was declared with an empty "id"'
+                area_id = yaml_data['id']
 
             elif field == 'robots':
                 # Ensure that a robot was not declared multiple times within a same area.
-                robots = []
+                robots = set()
                 for robot in yaml_data['robots']:
                     if robot in robots:
-                        print(f'Robot "{robot}" was declared multiple times within area "{self.id}"')
-                        sys.exit(1)
-                    robots.append(robot)
+                        return f'Robot "{robot}" was declared multiple times within area "{area_id}"'
+                    robots.add(robot)
 
                 # Ensure at least one robot was declared
                 if not robots:
-                    print(f'Area "{self.id}" was declared without robots')
-                    sys.exit(1)
+                    return f'Area "{area_id}" was declared without robots'
+
+        return None
+
+    def __parse_yaml_data(self, yaml_data):
+        """Parses the YAML data for a given entity of type "Area".
+
+        Execution is terminated if the passed YAML data is not valid (see "_validate").
+
+        Parameters
+        ----------
+        yaml_data : dict
+            The complete YAML data for the entity obtained from the input configuration file.
+        """
+
+        error = self._validate(yaml_data)
+        if error:
+            print(error)
+            sys.exit(1)
+
+        self.id = yaml_data['id']
 
     def __init__(self, yaml_data):
         """
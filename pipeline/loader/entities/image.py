@@ -22,6 +22,12 @@
 
 import sys
 
+from .defaults import DEFAULT_RESTART, ROS1_MASTER_URI, ROS2_DOMAIN_ID
+
+# Default tags for the Docker images of entities of type "Image" and "Global Image", respectively.
+ROBOT_IMAGE_TAG = '{{ROBOT_ROS_DISTRO}}'
+GLOBAL_IMAGE_TAG = 'latest'
+
 
 class Image:
     """
@@ -45,8 +51,11 @@ class Image:
         the complete YAML data for the entity obtained from the input configuration file.
     """
 
+    __slots__ = ('id', 'yaml_data')
+
     # WARNING: if adding more required fields ensure that field "id" is always the first.
     required_fields = ['id', 'image']
+    _required_fields = frozenset(required_fields)
 
     # flake8: noqa: C901
     def __parse_yaml_data(self, yaml_data, robot):
@@ -65,14 +74,17 @@ class Image:
             this parameter to None (in case an instance of the latter is to be considered).
         """
 
-        # Ensure the provided YAML data contains all the required fields
-        for field in self.required_fields:
+        # Ensure the provided YAML data contains all the required fields.
+        missing_fields = self._required_fields.difference(yaml_data)
+        if missing_fields:
+            for field in self.required_fields:
+                if field in missing_fields:
+                    print(f'An image was declared without required field "{field}" .')
+            sys.exit(1)
 
-            if field not in yaml_data:
-                print(f'An image was declared without required field "{field}" .')
-                sys.exit(1)
+        for field in self.required_fields:
 
-            elif field == 'id':
+            if field == 'id':
 
                 # Ensure provided id is not empty.
                 if not yaml_data['id']:
@@ -87,58 +99,60 @@ class Image:
                     self.id = '{}-{}'.format(robot.id, yaml_data['id'])
                 else:
                     self.id = yaml_data['id']
-                self.yaml_data['id'] = self.id
+                yaml_data['id'] = self.id
 
             elif field == 'image':
                 # Verify if Docker image's tag was specified or not.
                 # If not then use default value, which depends on whether the
                 # image is global or not.
-                parts = yaml_data['image'].split(':')
-                if len(parts) == 1:
+                # The tag follows the last colon, unless such colon precedes the port of a registry
+                # (e.g., "registry:5000/image").
+                image = yaml_data['image']
+                separator = image.rfind(':')
+                if separator == -1 or '/' in image[separator:]:
                     if robot:
-                        self.yaml_data['tag'] = '{{ROBOT_ROS_DISTRO}}'
+                        yaml_data['tag'] = ROBOT_IMAGE_TAG
                     else:
-                        self.yaml_data['tag'] = 'latest'
+                        yaml_data['tag'] = GLOBAL_IMAGE_TAG
                 else:  # use provided tag
-                    image, tag = parts
-                    self.yaml_data['image'] = image
-                    self.yaml_data['tag'] = tag
+                    yaml_data['image'] = image[:separator]
+                    yaml_data['tag'] = image[separator + 1:]
 
         # Process declared environmental variables, for entities of type "Image".
         # Add default environmental variables based on ROS version of the passed robot.
         # ROS1 distributions require the set of variables ROS_HOSTNAME and ROS_MASTER_URI.
         # ROS2 distributions require only the variable ROS_DOMAIN_ID to be set.
         environment = []
-        if 'environment' in self.yaml_data:
-            environment = self.yaml_data['environment']
+        if 'environment' in yaml_data:
+            environment = list(yaml_data['environment'])
         if robot:
             if robot.yaml_data['ros_version'] == "ROS1":
                 environment.append(f'ROS_HOSTNAME={self.id}')
-                environment.append('ROS_MASTER_URI=http://roscore-{{ROBOT_ID}}:{{ROBOT_ROS_PORT}}')
+                environment.append(ROS1_MASTER_URI)
             else:
-                environment.append('ROS_DOMAIN_ID={{ROBOT_ROS_DOMAIN}}')
-        self.yaml_data['environment'] = environment
+                environment.append(ROS2_DOMAIN_ID)
+        yaml_data['environment'] = environment
 
         if robot:
             # All images must also be automatically connected to the same area network as their robot.
             networks = []
             if 'networks' in yaml_data:
-                networks = yaml_data['networks']
-            networks.append(f"{robot.yaml_data['area']}-network")
-            self.yaml_data['networks'] = networks
+                networks = list(yaml_data['networks'])
+            networks.append(robot.network)
+            yaml_data['networks'] = networks
 
             # All ROS1 images must depend on the container running the master ROS node.
             depends_on = []
             if 'depends_on' in yaml_data:
-                depends_on = yaml_data['depends_on']
-            if robot.yaml_data['ros_version'] == 'ROS1':
-                depends_on.append(f"roscore-{robot.id}")
-            self.yaml_data['depends_on'] = depends_on
+                depends_on = list(yaml_data['depends_on'])
+            if robot.roscore:
+                depends_on.append(robot.roscore)
+            yaml_data['depends_on'] = depends_on
 
         # The default value for "restart" is "no".
         # Unless some other value is specified set default to "always".
         if 'restart' not in yaml_data:
-            self.yaml_data['restart'] = 'always'
+            yaml_data['restart'] = DEFAULT_RESTART
 
     def __init__(self, yaml_data, robot):
         """
@@ -150,5 +164,5 @@ class Image:
         robot : object
             The robotic agent where the ROS node represented by the entity will be run.
         """
-        self.yaml_data = yaml_data
-        self.__parse_yaml_data(yaml_data, robot)
+        self.yaml_data = dict(yaml_data)
+        self.__parse_yaml_data(self.yaml_data, robot)
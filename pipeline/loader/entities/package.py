@@ -21,7 +21,14 @@
 # THE SOFTWARE.
 
 import sys
-from distutils.util import strtobool
+
+from .defaults import DEFAULT_RESTART, ROS1_MASTER_URI, ROS2_DOMAIN_ID
+
+# URL schemes that may precede the first colon of a git repository.
+GIT_URL_SCHEMES = frozenset(['file', 'git', 'http', 'https', 'ssh'])
+
+# ROS distribution used to build the Dockerfile of a package (the one of its robot).
+ROBOT_ROS_DISTRO = '{{ROBOT_ROS_DISTRO}}'
 
 
 class Package:
@@ -37,6 +44,9 @@ class Package:
     id : str
         an unique identifier for the entity.
 
+    file_list_fields : list
+        the optional fields that, if declared, must contain a non-empty list of files.
+
     required_fields : list
         the required fields for an entity of this type to be considered valid.
 
@@ -44,8 +54,14 @@ class Package:
         the complete YAML data for the entity obtained from the input configuration file.
     """
 
+    __slots__ = ('id', 'yaml_data')
+
     # WARNING: if adding more required fields ensure that field "id" is always the first.
     required_fields = ['id', 'path', 'command']
+    _required_fields = frozenset(required_fields)
+
+    # Optional fields that, if declared, must contain a non-empty list of files.
+    file_list_fields = ['files', 'ssh']
 
     # flake8: noqa: C901
     def __parse_yaml_data(self, yaml_data, robot):
@@ -62,12 +78,15 @@ class Package:
             The robotic agent where the ROS node represented by the entity will be run.
         """
 
-        # Ensure the provided YAML data contains all the required fields
-        for field in self.required_fields:
+        # Ensure the provided YAML data contains all the required fields.
+        missing_fields = self._required_fields.difference(yaml_data)
+        if missing_fields:
+            for field in self.required_fields:
+                if field in missing_fields:
+                    print(f'A package was declared without required field "{field}" .')
+            sys.exit(1)
 
-            if field not in yaml_data:
-                print(f'A package was declared without required field "{field}" .')
-                sys.exit(1)
+        for field in self.required_fields:
 
             # Ensure provided id is not empty.
             if not yaml_data[field]:
@@ -81,115 +100,103 @@ class Package:
                 # An unique "id" is then obtained by joining the "id" of the "Robot" with the own entity's "id".
 
                 self.id = '{}-{}'.format(robot.id, yaml_data['id'])
-                self.yaml_data['id'] = self.id
+                yaml_data['id'] = self.id
 
         # If "git" field is present then add a list of the required "git clone" commands do the package YAML data.
         # This commands will later be used while rendering the package's Dockerfile, ensuring required repos are cloned.
-        if 'git' in self.yaml_data:
+        if 'git' in yaml_data:
 
-            if not self.yaml_data['git']:
+            if not yaml_data['git']:
                 print(f'Package "{self.id}" was declared with an empty value for "git"')
                 sys.exit(1)
 
+            # The "default" branch of a repository is the one named after the robot's ROS distribution.
+            default_branch = robot.yaml_data['ros_distro']
             git_cmds = []
-            for entry in self.yaml_data['git']:
-                parts = entry.split(':', 2)
-                if len(parts) == 1:  # verify if "default" branch is to be used
-                    git_cmds.append(f"git -C /ros_workspace/src clone -b {robot.yaml_data['ros'].split(':')[0]} {parts[0]}")
+            for entry in yaml_data['git']:
+                # The branch (if any) follows the last colon of the entry.
+                # A colon that only ends an URL scheme (e.g., "https://...") does not specify a branch.
+                repository, separator, branch = entry.rpartition(':')
+                if not separator or repository in GIT_URL_SCHEMES:  # use "default" branch
+                    git_cmds.append(f"git -C /ros_workspace/src clone -b {default_branch} {entry}")
                 else:
-                    git_cmds.append(f"git -C /ros_workspace/src clone -b {parts[-1]} {':'.join(parts[:-1])}")
-            self.yaml_data['git_cmds'] = git_cmds
-
-        declared_fields = set(list(self.yaml_data.keys()))
+                    git_cmds.append(f"git -C /ros_workspace/src clone -b {branch} {repository}")
+            yaml_data['git_cmds'] = git_cmds
 
         # Ensure that at least one of the fields "apt", "git" or "rosinstall" was selected.
         # There is no point in declaring an entity of this type if no ROS package is to be caontainerized.
         # NOTE: For "empty" containers entities of type "image" should be used instead.
-        if not [field for field in ['apt', 'git', 'rosinstall'] if field in declared_fields]:
+        if not any(field in yaml_data for field in ['apt', 'git', 'rosinstall']):
             print(f'Package "{self.id}" was declared without any ROS package.')
             sys.exit(1)
 
         # Ensure that fields "apt" and "rosinstall" are not empty, if selected.
-        if 'apt' in self.yaml_data:
-            if not self.yaml_data['apt']:
+        if 'apt' in yaml_data:
+            if not yaml_data['apt']:
                 print(f'Package "{self.id}" was declared with an empty value for "apt"')
                 sys.exit(1)
 
-        if 'rosinstall' in self.yaml_data:
-            if not self.yaml_data['rosinstall']:
+        if 'rosinstall' in yaml_data:
+            if not yaml_data['rosinstall']:
                 print(f'Package "{self.id}" was declared with an empty value for "rosinstall"')
                 sys.exit(1)
 
-        # Ensure that field "files" is not empty, if selected 
-        # Ensure that field "files" if a list of files
-        if 'files' in self.yaml_data:
-            
-            if not self.yaml_data['files']:
-                print(f'Package "{self.id}" was declared with an empty value for "files"')
-                sys.exit(1)
+        # Ensure that fields "files" and "ssh" are not empty, if selected.
+        # Ensure that fields "files" and "ssh" are lists of files.
+        for field in self.file_list_fields:
+            if field not in yaml_data:
+                continue
 
-            if not isinstance(self.yaml_data['files'], list):
-                print(f'Field "files" of package "{self.id}" is not of type list')
+            files = yaml_data[field]
+            if not files:
+                print(f'Package "{self.id}" was declared with an empty value for "{field}"')
                 sys.exit(1)
 
-            for filename in self.yaml_data['files']:
-                if not isinstance(filename, str):
-                    print(f'Field "files" of package "{self.id}" is not a list of files')
-                    sys.exit(1)
-
-        # Ensure that field "ssh" is not empty, if selected
-        # Ensure that field "ssh" if a list of files
-        if 'ssh' in self.yaml_data:
-            if not self.yaml_data['ssh']:
-                print(f'Package "{self.id}" was declared with an empty value for "ssh"')
+            if not isinstance(files, list):
+                print(f'Field "{field}" of package "{self.id}" is not of type list')
                 sys.exit(1)
 
-            if not isinstance(self.yaml_data['ssh'], list):
-                print(f'Field "ssh" of package "{self.id}" is not of type list')
+            if not all(isinstance(filename, str) for filename in files):
+                print(f'Field "{field}" of package "{self.id}" is not a list of files')
                 sys.exit(1)
 
-            for filename in self.yaml_data['ssh']:
-                if not isinstance(filename, str):
-                    print(f'Field "ssh" of package "{self.id}" is not a list of files')
-                    sys.exit(1)
-
         # Process declared environmental variables.
         # Add default environmental variables based on ROS version of the passed robot.
         # ROS1 distributions require the set of variables ROS_HOSTNAME and ROS_MASTER_URI.
         # ROS2 distributions require only the variable ROS_DOMAIN_ID to be set.
         environment = []
-        if 'environment' in self.yaml_data:
-            environment = self.yaml_data['environment']
+        if 'environment' in yaml_data:
+            environment = list(yaml_data['environment'])
         if robot.yaml_data['ros_version'] == "ROS1":
             environment.append(f'ROS_HOSTNAME={self.id}')
-            environment.append('ROS_MASTER_URI=http://roscore-{{ROBOT_ID}}:{{ROBOT_ROS_PORT}}')
+            environment.append(ROS1_MASTER_URI)
         else:
-            environment.append('ROS_DOMAIN_ID={{ROBOT_ROS_DOMAIN}}')
-        self.yaml_data['environment'] = environment
+            environment.append(ROS2_DOMAIN_ID)
+        yaml_data['environment'] = environment
 
         # Copy the passed robot's ROS version to this instance's YAML data to later ease the
         # rendering of the package Dockerfile.
-        self.yaml_data['ros'] = '{{ROBOT_ROS_DISTRO}}'
+        yaml_data['ros'] = ROBOT_ROS_DISTRO
 
         # All packages must be automatically connected to the same area network as their robot.
         networks = []
         if 'networks' in yaml_data:
-            networks = yaml_data['networks']
-        networks.append(f"{robot.yaml_data['area']}-network")
-        self.yaml_data['networks'] = networks
+            networks = list(yaml_data['networks'])
+        networks.append(robot.network)
+        yaml_data['networks'] = networks
 
         # All ROS1 packages must depend on the container running the master ROS node.
         depends_on = []
         if 'depends_on' in yaml_data:
-            depends_on = yaml_data['depends_on']
-        if robot.yaml_data['ros_version'] == 'ROS1':
-            depends_on.append(f"roscore-{robot.id}")
-        self.yaml_data['depends_on'] = depends_on
+            depends_on = list(yaml_data['depends_on'])
+        if robot.roscore:
+            depends_on.append(robot.roscore)
+        yaml_data['depends_on'] = depends_on
 
         # The default value for "restart" is "no".
         # Unless some other value is specified set default to "always".
         if 'restart' not in yaml_data:
-            self.yaml_data['restart'] = 'always'
+            yaml_data['restart'] = DEFAULT_RESTART
 
     def __init__(self, yaml_data, robot):
         """
@@ -201,5 +208,5 @@ class Package:
         robot : object
             The robotic agent where the ROS node represented by the entity will be run.
         """
-        self.yaml_data = yaml_data
-        self.__parse_yaml_data(yaml_data, robot)
+        self.yaml_data = dict(yaml_data)
+        self.__parse_yaml_data(self.yaml_data, robot)
@@ -22,11 +22,23 @@
 
 import sys
 
-# List of supported ROS and ROS2 distros.
+from .defaults import DEFAULT_RESTART
+
+# Mapping between supported ROS and ROS2 distros and their ROS version.
 # NOTE: probably more distros are supported - list
 # only the distros that were actually tested.
-ROS1_DISTROS = ['melodic', 'noetic']
-ROS2_DISTROS = ['foxy']
+ROS_VERSIONS = {
+    'melodic': 'ROS1',
+    'noetic': 'ROS1',
+    'foxy': 'ROS2'
+}
+
+# Name and default value of the "ros_metadata" of a robot for each ROS version.
+# Robots using ROS1 declare the "port" of the master node while robots using ROS2 declare a "domain".
+ROS_METADATA = {
+    'ROS1': ('port', 11311),
+    'ROS2': ('domain', 42)
+}
 
 
 class Robot:
@@ -41,18 +53,58 @@ class Robot:
     id : str
         an unique identifier for the entity.
 
+    network : str
+        the name of the network of the area where the robot operates.
+
     required_fields : list
         the required fields for an entity of this type to be considered valid.
 
+    roscore : str
+        the name of the container running the master ROS node (None for ROS2 robots).
+
     yaml_data : dict
         the complete YAML data for the entity obtained from the input configuration file.
     """
 
+    __slots__ = ('id', 'network', 'roscore', 'yaml_data')
+
     # WARNING: if adding more required fields ensure that field "id" is always the first.
     # Depending on the value of required field "ros" some other fields are also required ("port" and "domain").
     # The logic that ensures these extra required fields are present is already implemented
     # in inside function "__parse_yaml_data". Therefore don't add such fields to this list.
     required_fields = ['id', 'ros']
+    _required_fields = frozenset(required_fields)
+
+    def __parse_ros_metadata(self, metadata, value):
+        """Parses the value of the "port" (ROS1) or "domain" (ROS2) declared for a given entity of type "Robot".
+
+        Parameters
+        ----------
+        metadata : str
+            The name of the declared value (either "port" or "domain").
+
+        value : str
+            The declared value.
+
+        Returns
+        -------
+        int
+            the declared value as an integer.
+        """
+
+        if not value:  # an empty value for "port" or "domain" was passed
+            print(f'Robot "{self.id}" was declared without a value for {metadata}')
+            sys.exit(1)
+
+        # Only non-negative integers are valid values for "port" and "domain".
+        # Surrounding whitespaces and an explicit plus sign are allowed (as they are by "int").
+        value = value.strip()
+        digits = value[1:] if value.startswith('+') else value
+        if not digits.isdecimal():
+            print(f'Robot "{self.id}" was declared with an invalid value for {metadata} "{value}"')
+            sys.exit(1)
+
+        return int(value)
 
     # flake8: noqa: C901
     def __parse_yaml_data(self, yaml_data):
@@ -71,13 +123,16 @@ class Robot:
         """
 
         # Ensure the provided YAML data contains all the required fields.
-        for field in self.required_fields:
+        missing_fields = self._required_fields.difference(yaml_data)
+        if missing_fields:
+            for field in self.required_fields:
+                if field in missing_fields:
+                    print(f'A robot was declared without required field "{field}" .')
+            sys.exit(1)
 
-            if field not in yaml_data:
-                print(f'A robot was declared without required field "{field}" .')
-                sys.exit(1)
+        for field in self.required_fields:
 
-            elif field == 'id':
+            if field == 'id':
                 # Ensure provided id is not empty
                 if not yaml_data['id']:
                     print('A robot was declared with an empty "id"')
@@ -86,119 +141,97 @@ class Robot:
 
             elif field == 'ros':
 
-                parts = self.yaml_data['ros'].split(':')
+                parts = yaml_data['ros'].split(':')
 
                 if not parts[0]:
                     print(f'Robot "{self.id}" was declared an empty ROS distribution.')
                     sys.exit(1)
 
                 # The attribute "ros_version" is added to the YAML data to avoid passing
-                # the arrays of distributions to later phases of the pipeline, as this
+                # the mapping of distributions to later phases of the pipeline, as this
                 # disambiguation between ROS and ROS2 is crucial.
-                if parts[0] in ROS1_DISTROS:
-                    self.yaml_data['ros_version'] = 'ROS1'
-                    self.yaml_data['ros_distro'] = parts[0]
-                    # Robots using ROS1 must also declare a "port".
-                    if len(parts) == 1:  # use default value
-                        self.yaml_data['ros_metadata'] = 11311
-                    else:  # use passed value
-                        if parts[-1]:
-                            try:
-                                self.yaml_data['ros_metadata'] = int(parts[-1])
-                            except ValueError:
-                                print(f'Robot "{self.id}" was declared with an invalid value for port "{parts[-1]}"')
-                                sys.exit(1)
-                        else:  # and invalid value for "port" was passed
-                            print(f'Robot "{self.id}" was declared without a value for port')
-                            sys.exit(1)
-
-                elif parts[0] in ROS2_DISTROS:
-                    self.yaml_data['ros_version'] = 'ROS2'
-                    self.yaml_data['ros_distro'] = parts[0]
-                    # Robots using ROS2 must also declare a "domain".
-                    if len(parts) == 1:  # use default value
-                        self.yaml_data['ros_metadata'] = 42
-                    else:  # use passed value
-                        if parts[-1]:
-                            try:
-                                self.yaml_data['ros_metadata'] = int(parts[-1])
-                            except ValueError:
-                                print(f'Robot "{self.id}" was declared with an invalid value for domain "{parts[-1]}"')
-                                sys.exit(1)
-                        else:
-                            print(f'Robot "{self.id}" was declared without a value for domain')
-                            sys.exit(1)
-
                 # Ensure a supported ROS distribution was selected.
-                else:
+                ros_version = ROS_VERSIONS.get(parts[0])
+                if not ros_version:
                     print(f'Found invalid or unsupported ROS distribution "{parts[0]}"')
                     sys.exit(1)
+                yaml_data['ros_version'] = ros_version
+                yaml_data['ros_distro'] = parts[0]
+
+                # Robots using ROS1 must also declare a "port" and robots using ROS2 a "domain".
+                metadata, default_value = ROS_METADATA[ros_version]
+                if len(parts) == 1:  # use default value
+                    yaml_data['ros_metadata'] = default_value
+                else:  # use passed value
+                    yaml_data['ros_metadata'] = self.__parse_ros_metadata(metadata, parts[-1])
+
+        # The names of the area network and of the master ROS node container are shared by all
+        # packages and images of the robot and are therefore computed only once.
+        self.network = f"{yaml_data['area']}-network"
+        self.roscore = f'roscore-{self.id}' if yaml_data['ros_version'] == 'ROS1' else None
 
         environment = []
-        if 'environment' in self.yaml_data:
-            environment = self.yaml_data['environment']
+        if 'environment' in yaml_data:
+            environment = list(yaml_data['environment'])
         if yaml_data['ros_version'] == "ROS1":
-            environment.append(f'ROS_HOSTNAME=roscore-{self.id}')
-            environment.append(f"ROS_MASTER_URI=http://roscore-{self.id}:{yaml_data['ros_metadata']}")
+            environment.append(f'ROS_HOSTNAME={self.roscore}')
+            environment.append(f"ROS_MASTER_URI=http://{self.roscore}:{yaml_data['ros_metadata']}")
         else:
             environment.append(f"ROS_DOMAIN_ID={yaml_data['ros_metadata']}")
-        self.yaml_data['environment'] = environment
+        yaml_data['environment'] = environment
 
         # Automatically export ports so that nodes may be able to communicate with the master node.
         # This is only required for ROS1 robots.
         if yaml_data['ros_version'] == "ROS1":
-            self.yaml_data['ports'] = [f"{yaml_data['ros_metadata']}:{yaml_data['ros_metadata']}"]
-            self.yaml_data['command'] = f"roscore --port {yaml_data['ros_metadata']}"
+            yaml_data['ports'] = [f"{yaml_data['ros_metadata']}:{yaml_data['ros_metadata']}"]
+            yaml_data['command'] = f"roscore --port {yaml_data['ros_metadata']}"
 
         # Since a same entity of type "Package" and "Image" may be used several times
         # within distinct robots, it is crucial to ensure that each instance of a same entity has a unique "id".
         # An unique "id" is then obtained by joining the "id" of the "Robot" with the own entity's "id".
 
         images = []
-        if 'images' in yaml_data:
-            for image in yaml_data['images']:
-                if not image:
-                    print(f'An image with no identifier was passed within robot "{self.id}"')
-                    sys.exit(1)
-                # Ensure no image was declared multiple times.
-                image_id = f'{self.id}-{image}'
-                if image_id in images:
-                    print(f'A same image "{image}" was declared multiple times within robot "{self.id}"')
-                    sys.exit(1)
-                images.append(image_id)
-        self.yaml_data['images'] = images
+        declared_images = set()
+        for image in yaml_data.get('images', ()):
+            if not image:
+                print(f'An image with no identifier was passed within robot "{self.id}"')
+                sys.exit(1)
+            # Ensure no image was declared multiple times.
+            if image in declared_images:
+                print(f'A same image "{image}" was declared multiple times within robot "{self.id}"')
+                sys.exit(1)
+            declared_images.add(image)
+            images.append(f'{self.id}-{image}')
+        yaml_data['images'] = images
 
         packages = []
-        if 'packages' in yaml_data:
-            for package in yaml_data['packages']:
-                if not package:
-                    print(f'A package with no identifier was passed within robot "{self.id}"')
-                    sys.exit(1)
-                # Ensure no package was declared multiple times.
-                package_id = f'{self.id}-{package}'
-                if package_id in packages:
-                    print(f'A same package "{package}" was declared multiple times within robot "{self.id}"')
-                    sys.exit(1)
-                packages.append(package_id)
-        self.yaml_data['packages'] = packages
+        declared_packages = set()
+        for package in yaml_data.get('packages', ()):
+            if not package:
+                print(f'A package with no identifier was passed within robot "{self.id}"')
+                sys.exit(1)
+            # Ensure no package was declared multiple times.
+            if package in declared_packages:
+                print(f'A same package "{package}" was declared multiple times within robot "{self.id}"')
+                sys.exit(1)
+            declared_packages.add(package)
+            packages.append(f'{self.id}-{package}')
+        yaml_data['packages'] = packages
 
         # Ensure that at least a package or an image is being declared.
         if not images and not packages:
             print(f'Robot "{self.id}" was declared without images or packages.')
             sys.exit(1)
 
-        # Prepare robot networks. Even if no network is specified, all robots must be
-        # automatically connected to their area's network.
-        networks = []
-        if 'networks' in yaml_data:
-            networks = yaml_data['networks']
-        networks = [f"{yaml_data['area']}-network"]
-        self.yaml_data['networks'] = networks
+        # Prepare robot networks. All robots must be automatically connected to their area's network.
+        # NOTE: only the area network is kept, as only the networks of packages and images are declared
+        # in the output file (any other network of the container running the master ROS node would be undefined).
+        yaml_data['networks'] = [self.network]
 
         # The default value for "restart" is "no".
         # Unless some other value is specified set default to "always".
         if 'restart' not in yaml_data:
-            self.yaml_data['restart'] = 'always'
+            yaml_data['restart'] = DEFAULT_RESTART
 
     def __init__(self, yaml_data, area):
         """
@@ -211,7 +244,7 @@ class Robot:
             The area where the robot operates.
         """
 
-        self.yaml_data = yaml_data
+        self.yaml_data = dict(yaml_data)
         self.yaml_data['area'] = area['id']
 
-        self.__parse_yaml_data(yaml_data)
+        self.__parse_yaml_data(self.yaml_data)
@@ -29,6 +29,12 @@ from .entities.image import Image
 from .entities.package import Package
 from .entities.robot import Robot
 
+# Use the LibYAML based parser whenever PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
 
 class EntityLoader():
     """
@@ -57,18 +63,6 @@ class EntityLoader():
         the complete YAML data contained in the input configuration file.
     """
 
-    areas = {}
-    global_images = {}
-    images = {}
-    packages = {}
-    robots = {}
-
-    # Contains all used values of the "port" field (ROS1 robots)
-    __used_ports = []
-
-    # Contains all used values of the "domain" field (ROS2 robots)
-    __used_domains = []
-
     def __init__(self, configuration_file_path):
         """
         Parameters
@@ -77,6 +71,19 @@ class EntityLoader():
             The path for an YAML configuration input file.
         """
 
+        # NOTE: all placeholders belong to each instance (class attributes would be shared between instances).
+        self.areas = {}
+        self.global_images = {}
+        self.images = {}
+        self.packages = {}
+        self.robots = {}
+
+        # Contains all used values of the "port" field (ROS1 robots)
+        self.__used_ports = set()
+
+        # Contains all used values of the "domain" field (ROS2 robots)
+        self.__used_domains = set()
+
         self._load_data(configuration_file_path)
 
     # Load all entities
@@ -90,14 +97,22 @@ class EntityLoader():
                 Path for the YAML configuration file to load.
             """
 
-        # Open configuration file and ensure proper extension file.
+        # Ensure proper extension file.
         _, extension = os.path.splitext(configuration_file_path)
-        with open(configuration_file_path, 'r') as configuration_file:
-            if extension in ['.yaml', '.yml']:
-                self.yaml_data = yaml.safe_load(configuration_file)
-            else:
-                print(f'Unsupported type "{extension}" for configuration file')
-                sys.exit(1)
+        if extension not in ['.yaml', '.yml']:
+            print(f'Unsupported type "{extension}" for configuration file')
+            sys.exit(1)
+
+        # Read the entire configuration file at once and parse it from memory.
+        with open(configuration_file_path, 'rb') as configuration_file:
+            contents = configuration_file.read()
+        self.yaml_data = yaml.load(contents, Loader=YAMLLoader)
+
+        # Index the declared robots, packages and images by their "id".
+        # Entities are listed by their "id" and this way each one of them is found in constant time.
+        self.__declared_robots = self._index_entities('robot', 'A robot', self.yaml_data.get('robots', []))
+        self.__declared_packages = self._index_entities('package', 'A package', self.yaml_data.get('packages', []))
+        self.__declared_images = self._index_entities('image', 'An image', self.yaml_data.get('images', []))
 
         # Entities are loaded hierarchically according to the following order:
         # - Areas
@@ -109,16 +124,13 @@ class EntityLoader():
             # Ensure that at least one entity of type "Area" is declared.
             for area in self.yaml_data['areas']:
                 self._add_entity_area(area)
-                try:
-                    for robot_id in area['robots']:
-                        # Load all declared robots within an area.
-                        # NOTE: robots belonging to unknown areas will be ignored.
-                        for robot in self.yaml_data['robots']:
-                            if robot['id'] == robot_id:
-                                self._add_entity_robot(robot, area)
-                except KeyError:
-                    print(f'Robot "{robot_id}" was listed but not declared.')
-                    sys.exit(1)
+                for robot_id in area['robots']:
+                    # Load all declared robots within an area.
+                    # NOTE: robots belonging to unknown areas will be ignored.
+                    if robot_id not in self.__declared_robots:
+                        print(f'Robot "{robot_id}" was listed but not declared.')
+                        sys.exit(1)
+                    self._add_entity_robot(self.__declared_robots[robot_id], area)
 
         except KeyError:
             print('No robotic areas were declared')
@@ -129,6 +141,66 @@ class EntityLoader():
             for global_image in self.yaml_data['globals']:
                 self._add_entity_image(global_image, None)
 
+        self._validate_references()
+
+    def _validate_references(self):
+        """Ensures that all images and packages listed within the loaded robots were declared.
+
+        All found errors are reported at once.
+        """
+
+        errors = []
+        for area in self.yaml_data['areas']:
+            for robot_id in area['robots']:
+                robot = self.__declared_robots[robot_id]
+                for image_id in robot.get('images', []):
+                    if image_id not in self.__declared_images:
+                        errors.append(f'Image "{image_id}" was listed but not declared.')
+                for package_id in robot.get('packages', []):
+                    if package_id not in self.__declared_packages:
+                        errors.append(f'Package "{package_id}" was listed but not declared.')
+
+        if errors:
+            for error in errors:
+                print(error)
+            sys.exit(1)
+
+    def _index_entities(self, entity_type, entity, entities):
+        """Indexes the YAML data of all declared entities of a given type by their "id".
+
+        Ensures that each declared entity has a non-empty and unique "id" value.
+
+        Parameters
+        ----------
+        entity_type : str
+            The type of the entities to index (either "robot", "package" or "image").
+
+        entity : str
+            The noun phrase naming a single entity of the given type in messages (e.g., "An image").
+
+        entities : list
+            YAML data of all declared entities of the given type.
+
+        Returns
+        -------
+        dict
+            the YAML data of each declared entity referenced by its "id".
+        """
+
+        index = {}
+        for yaml_data in entities:
+            if 'id' not in yaml_data:
+                print(f'{entity} was declared without required field "id" .')
+                sys.exit(1)
+            entity_id = yaml_data['id']
+            if not entity_id:
+                print(f'{entity} was declared with an empty "id"')
+                sys.exit(1)
+            if index.setdefault(entity_id, yaml_data) is not yaml_data:
+                print(f'Found multiple {entity_type}s with same id "{entity_id}"')
+                sys.exit(1)
+        return index
+
     def _add_entity_area(self, yaml_data):
         """Loads a new entity of type "Area".
 
@@ -144,11 +216,10 @@ class EntityLoader():
         area = Area(yaml_data)
 
         # Ensures all entities have an unique "id".
-        if area.id in self.areas:
+        # NOTE: a single lookup both stores the entity and detects if its "id" was already used.
+        if self.areas.setdefault(area.id, area) is not area:
             print(f'Found multiple areas with same id "{area.id}"')
             sys.exit(1)
-        else:
-            self.areas[area.id] = area
 
     # Load an entity of type 'Robot'
     # flake8: noqa: C901
@@ -174,44 +245,37 @@ class EntityLoader():
         robot = Robot(yaml_data, area)
 
         # Ensures all entities have an unique "id".
-        if robot.id in self.robots:
+        if self.robots.setdefault(robot.id, robot) is not robot:
             print(f'Found multiple robots with same id "{robot.id}"')
             sys.exit(1)
-        else:
-
-            # Ensure unique values for "port".
-            if robot.yaml_data['ros_version'] == 'ROS1':
-                port = robot.yaml_data['ros_metadata']
-                if port in self.__used_ports:
-                    print(f'Multiple ROS robots using port "{port}"')
-                    sys.exit(1)
-                self.__used_ports.append(port)
-
-            # Ensure unique values for "domain".
-            if robot.yaml_data['ros_version'] == 'ROS2':
-                domain = robot.yaml_data['ros_metadata']
-                if domain in self.__used_domains:
-                    print(f'Multiple ROS2 robots using domain "{domain}"')
-                    sys.exit(1)
-                self.__used_domains.append(domain)
-
-            self.robots[robot.id] = robot
 
-        try:
-            # Load an entity of type "Package" for all packages associated with the loaded robot.
-            for package in self.yaml_data['packages']:
-                if f"{robot.id}-{package['id']}" in robot.yaml_data['packages']:
-                    self._add_entity_package(package, robot)
-        except KeyError:
-            pass
+        # Ensure unique values for "port".
+        if robot.yaml_data['ros_version'] == 'ROS1':
+            port = robot.yaml_data['ros_metadata']
+            if port in self.__used_ports:
+                print(f'Multiple ROS robots using port "{port}"')
+                sys.exit(1)
+            self.__used_ports.add(port)
 
-        try:
-            # Load an entity of type "Image" for all images associated with the loaded robot.
-            for image in self.yaml_data['images']:
-                if f"{robot.id}-{image['id']}" in robot.yaml_data['images']:
-                    self._add_entity_image(image, robot)
-        except KeyError:
-            pass
+        # Ensure unique values for "domain".
+        if robot.yaml_data['ros_version'] == 'ROS2':
+            domain = robot.yaml_data['ros_metadata']
+            if domain in self.__used_domains:
+                print(f'Multiple ROS2 robots using domain "{domain}"')
+                sys.exit(1)
+            self.__used_domains.add(domain)
+
+        # Load an entity of type "Package" for all packages associated with the loaded robot.
+        # NOTE: listed packages that were not declared are reported later (see "_validate_references").
+        for package_id in yaml_data.get('packages', []):
+            if package_id in self.__declared_packages:
+                self._add_entity_package(self.__declared_packages[package_id], robot)
+
+        # Load an entity of type "Image" for all images associated with the loaded robot.
+        # NOTE: listed images that were not declared are reported later (see "_validate_references").
+        for image_id in yaml_data.get('images', []):
+            if image_id in self.__declared_images:
+                self._add_entity_image(self.__declared_images[image_id], robot)
 
     # Load an entity of type 'Image'
     def _add_entity_image(self, yaml_data, robot):
@@ -237,15 +301,13 @@ class EntityLoader():
 
         # Select the place to store the loaded entity based on its type.
         if robot:  # storing an entity of type "Image"
-            if image.id in self.images:
+            if self.images.setdefault(image.id, image) is not image:
                 print(f'Found multiple images with same id "{image.id}"')
                 sys.exit(1)
-            self.images[image.id] = image
         else:  # storing an entity of type "Global Image"
-            if image.id in self.global_images:
+            if self.global_images.setdefault(image.id, image) is not image:
                 print(f'Found multiple global images with same id "{image.id}"')
                 sys.exit(1)
-            self.global_images[image.id] = image
 
     # Load an entity of type 'Package'
     def _add_entity_package(self, yaml_data, robot):
@@ -267,8 +329,6 @@ class EntityLoader():
         package = Package(yaml_data, robot)
 
         # Ensure that each loaded package has an unique "id".
-        if package.id in self.packages:
+        if self.packages.setdefault(package.id, package) is not package:
             print(f'Found multiple packages with same id "{package.id}"')
             sys.exit(1)
-        else:
-            self.packages[package.id] = package
@@ -23,8 +23,38 @@
 import os
 import shutil
 import sys
-from jinja2 import Template
-from pkg_resources import resource_string
+from functools import lru_cache
+from itertools import chain
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
+
+# Indentation of each nesting level of the rendered Docker Compose YAML file (two spaces per level).
+# Services are only ever nested a few levels deep and therefore all indentations are computed only once.
+INDENTATIONS = tuple('  ' * number_tabs for number_tabs in range(8))
+
+# Fields of entities of type "Robot" that are not part of the service running the master ROS node.
+ROBOT_SKIPPED_FIELDS = frozenset(['area', 'images', 'packages', 'ros', 'ros_metadata', 'ros_version', 'vars'])
+
+# Fields of entities of type "Image", "Global Image" and "Package" that are not part of their services.
+SERVICE_SKIPPED_FIELDS = frozenset(['apt', 'command', 'files', 'git', 'git_cmds', 'ros', 'ssh', 'tag', 'vars'])
+
+
+@lru_cache(maxsize=None)
+def templates_environment():
+    """ Returns the environment used to load all templates of this package.
+
+    The environment (and therefore all templates it loads) is created only once per process.
+    Compiled templates are also cached on disk (in the system's temporary directory) and reused between executions.
+
+    Returns
+    -------
+    jinja2.Environment
+        the environment of all templates.
+    """
+
+    return Environment(
+        loader=PackageLoader(__package__, 'templates'),
+        bytecode_cache=FileSystemBytecodeCache()
+    )
 
 
 class Renderizer:
@@ -102,26 +132,11 @@ class Renderizer:
         labeled_volumes = []
         networks = []
 
-        for image in self.images:
-            image_direct_volumes, image_labeled_volumes = self.__extract_volumes(image)
-            direct_volumes += image_direct_volumes
-            labeled_volumes += image_labeled_volumes
-
-            networks += self.__extract_networks(image)
-
-        for image in self.global_images:
-            image_direct_volumes, image_labeled_volumes = self.__extract_volumes(image)
-            direct_volumes += image_direct_volumes
-            labeled_volumes += image_labeled_volumes
-
-            networks += self.__extract_networks(image)
-
-        for package in self.packages:
-            package_direct_volumes, package_labeled_volumes = self.__extract_volumes(package)
-            direct_volumes += package_direct_volumes
-            labeled_volumes += package_labeled_volumes
-
-            networks += self.__extract_networks(package)
+        for entity in chain(self.images, self.global_images, self.packages):
+            entity_direct_volumes, entity_labeled_volumes, entity_networks = self.__extract_volumes_and_networks(entity)
+            direct_volumes.extend(entity_direct_volumes)
+            labeled_volumes.extend(entity_labeled_volumes)
+            networks.extend(entity_networks)
 
         # Remove duplicates
         self.direct_volumes = list(dict.fromkeys(direct_volumes))
@@ -131,8 +146,10 @@ class Renderizer:
         # Render output files
         self.__render()
 
-    def __tabs(self, number_tabs, tab_symbol='  '):
-        return (f'{tab_symbol}' * number_tabs)
+    def __tabs(self, number_tabs):
+        if number_tabs < len(INDENTATIONS):
+            return INDENTATIONS[number_tabs]
+        return '  ' * number_tabs
 
     def __stringify_service_robot(self, yaml_data, tabs=1):
 
@@ -140,192 +157,206 @@ class Renderizer:
         if yaml_data['ros_version'] == 'ROS2':
             return ''
 
-        final_str = f"{self.__tabs(tabs)}roscore-{yaml_data['id']}:\n"
+        # Lines are gathered in a list and joined only once at the end.
+        field_tabs = self.__tabs(tabs + 1)
+        entry_tabs = self.__tabs(tabs + 2)
+        lines = [f"{self.__tabs(tabs)}roscore-{yaml_data['id']}:\n"]
 
         for field, value in yaml_data.items():
 
-            if field not in ['area', 'images', 'packages', 'ros', 'ros_metadata', 'ros_version', 'vars']:
-
-                type_data = type(value)
+            if field not in ROBOT_SKIPPED_FIELDS:
 
-                if type_data in [bool, float, int, str]:
+                if isinstance(value, (bool, float, int, str)):
 
                     if field == 'id':
-                        final_str += f"{self.__tabs(tabs + 1)}container_name: roscore-{value}\n"
+                        lines.append(f"{field_tabs}container_name: roscore-{value}\n")
                     elif field == 'ros_distro':
-                        final_str += f"{self.__tabs(tabs + 1)}image: ros:{value}\n"
+                        lines.append(f"{field_tabs}image: ros:{value}\n")
                     else:
-                        final_str += f'{self.__tabs(tabs + 1)}{field}: {value}\n'
+                        lines.append(f'{field_tabs}{field}: {value}\n')
 
-                elif type_data in [list]:
-                    final_str += f'{self.__tabs(tabs + 1)}{field}:\n'
+                elif isinstance(value, list):
+                    lines.append(f'{field_tabs}{field}:\n')
                     for entry in value:
-                        final_str += f'{self.__tabs(tabs + 2)}- {entry}\n'
+                        lines.append(f'{entry_tabs}- {entry}\n')
 
             # TODO: implement this mechanism for dictionaries
             # else:  # "dict"
-            #     final_str += self.__stringify_service(field_value, tabs + f"['{field}']")
+            #     lines.append(self.__stringify_service(field_value, tabs + f"['{field}']"))
 
-        return final_str
+        return ''.join(lines)
 
     def __stringify_service(self, yaml_data, tabs=1):
 
-        final_str = f'{self.__tabs(tabs)}{yaml_data["id"]}:\n'
+        # Lines are gathered in a list and joined only once at the end.
+        field_tabs = self.__tabs(tabs + 1)
+        entry_tabs = self.__tabs(tabs + 2)
+        lines = [f'{self.__tabs(tabs)}{yaml_data["id"]}:\n']
 
         for field, value in yaml_data.items():
 
-            if field not in ['apt', 'command', 'files', 'git', 'git_cmds', 'ros', 'ssh', 'tag', 'vars']:
+            if field not in SERVICE_SKIPPED_FIELDS:
 
-                type_data = type(value)
-
-                if type_data in [bool, float, int, str]:
+                if isinstance(value, (bool, float, int, str)):
 
                     if field == 'id':
-                        final_str += f"{self.__tabs(tabs + 1)}container_name: {value}\n"
+                        lines.append(f"{field_tabs}container_name: {value}\n")
                     elif field == 'image':  # an image
-                        final_str += f"{self.__tabs(tabs + 1)}image: {value}:{yaml_data['tag']}\n"
+                        lines.append(f"{field_tabs}image: {value}:{yaml_data['tag']}\n")
                     elif field == 'path':
-                        final_str += f"{self.__tabs(tabs + 1)}build: {value}{yaml_data['id']}\n"
+                        lines.append(f"{field_tabs}build: {value}{yaml_data['id']}\n")
                     else:
-                        final_str += f'{self.__tabs(tabs + 1)}{field}: {value}\n'
+                        lines.append(f'{field_tabs}{field}: {value}\n')
 
-                elif type_data in [list]:
+                elif isinstance(value, list):
                     if value:  # ensure the list is not empty
-                        final_str += f'{self.__tabs(tabs + 1)}{field}:\n'
+                        lines.append(f'{field_tabs}{field}:\n')
                         for entry in value:
-                            final_str += f'{self.__tabs(tabs + 2)}- {entry}\n'
+                            lines.append(f'{entry_tabs}- {entry}\n')
 
             # TODO: implement this mechanism for dictionaries
             # else:  # "dict"
-            #     final_str += self.__stringify_service(field_value, tabs + f"['{field}']")
+            #     lines.append(self.__stringify_service(field_value, tabs + f"['{field}']"))
 
-        return final_str
+        return ''.join(lines)
 
-    def __extract_volumes(self, yaml_data):
-        """Extract and filter all used volumes from an entity's YAML data.
+    def __extract_volumes_and_networks(self, yaml_data):
+        """Extract and filter all used volumes and networks from an entity's YAML data.
 
         Parameters
         ----------
         yaml_data : dict
             An entity's YAML data.
+
+        Returns
+        -------
+        tuple
+            the direct volumes, labeled volumes and networks used by the entity.
         """
 
         direct_volumes = []
         labeled_volumes = []
 
-        if 'volumes' in yaml_data:
-            for volume in yaml_data['volumes']:
-                parts = volume.split(':')
-                if '/' in parts[0]:
-                    direct_volumes.append(parts[0])
-                else:  # labeled volume
-                    labeled_volumes.append(parts[0])
-        return direct_volumes, labeled_volumes
+        # Only the source of each volume (i.e., what precedes the first colon) is of interest.
+        for volume in yaml_data.get('volumes', []):
+            source, _, _ = volume.partition(':')
+            if '/' in source:
+                direct_volumes.append(source)
+            else:  # labeled volume
+                labeled_volumes.append(source)
+        return direct_volumes, labeled_volumes, yaml_data.get('networks', [])
 
-    def __extract_networks(self, yaml_data):
-        """Extract all used networks from an entity's YAML data.
+    def _create_folder(self, path):
+        """ Create a folder to place Dockerfiles in case it does not exist already.
 
         Parameters
         ----------
-        yaml_data : dict
-            An entity's YAML data.
+        path : str
+            Path where folder is to be created.
         """
 
-        if 'networks' in yaml_data:
-            return yaml_data['networks']
-        return []
+        os.makedirs(path, exist_ok=True)
 
-    def _create_folder(self, path):
-        """ Create a folder to place Dockerfiles in case it does not exist already.
+    def __render_package(self, package, packages_path, dockerfile_templater):
+        """ Copies all files required by a package and renders its Dockerfile.
 
         Parameters
         ----------
-        path : str
-            Path where folder is to be created.
+        package : dict
+            The YAML data of the package.
+
+        packages_path : str
+            Path of the folder where all packages are placed.
+
+        dockerfile_templater : jinja2.Template
+            The template of Dockerfiles.
         """
 
-        if not os.path.exists(path):
-            os.makedirs(path)
+        # Create a separate folder for each package.
+        package_path = os.path.join(packages_path, package['id'])
+        self._create_folder(package_path)
+
+        # Create folder for SSH related files if specified.
+        if 'ssh' in package:
+            ssh_folder = os.path.join(package_path, 'ssh')
+            self._create_folder(ssh_folder)
+            for ssh_path in package['ssh']:
+                try:
+                    file_name = os.path.basename(ssh_path)
+                    shutil.copyfile(ssh_path, os.path.join(ssh_folder, file_name))
+                except FileNotFoundError:
+                    print(f'SSH file "{ssh_path}" was not found.')
+                    sys.exit(1)
+
+        if 'files' in package:
+
+            # Create folder for files if specified.
+            files_folder = os.path.join(package_path, 'files')
+            self._create_folder(files_folder)
+
+            if 'volumes' in package:
+                volumes = package["volumes"]
+            else:
+                volumes = []
+
+            for file_path in package['files']:
+
+                # The path of the file within the container follows the last colon.
+                # NOTE: this way the path of the original file may contain colons (e.g., a Windows drive).
+                external_file_path, separator, internal_file_path = file_path.rpartition(':')
+                if not separator:
+                    print(f'Invalid file declaration "{file_path}"')
+                    sys.exit(1)
+
+                try:
+                    # Make a copy of the file
+                    copied_file_path = os.path.join(files_folder, os.path.basename(external_file_path.strip()))
+                    shutil.copyfile(external_file_path, copied_file_path)
+                except FileNotFoundError as e:
+                    print(f'File "{external_file_path}" was not found.')
+                    sys.exit(1)
+
+                # Create a volume for the copied file
+                volumes.append(f"{copied_file_path}:{internal_file_path}")
+
+            package["volumes"] = volumes
+
+        # Render Dockerfile for each package
+        with open(os.path.join(package_path, 'Dockerfile'), 'w+') as out:
+            dockerfile_templater.stream(package=package).dump(out)
 
     def __render(self):
         """  Renders the final Docker Compose YAMl file as well as all required Dockerfiles.
         """
 
+        environment = templates_environment()
+
         # Open template of Dockerfile.
-        dockerfile_template = resource_string(__name__, 'templates/dockerfile.j2').decode('utf-8')
-        dockerfile_templater = Template(dockerfile_template)
+        dockerfile_templater = environment.get_template('dockerfile.j2')
 
         # Create folder to place the Dockerfile for each package.
-        path = '/'.join(self.output_file_path.split('/')[:-1])
-        packages_path = f'{path}/packages'
+        # NOTE: the folder is placed alongside the final Docker Compose YAML file.
+        path = os.path.dirname(self.output_file_path) or '.'
+        packages_path = os.path.join(path, 'packages')
         self._create_folder(packages_path)
 
         for package in self.packages:
-
-            # Create a separate folder for each package.
-            self._create_folder(f'{packages_path}/{package["id"]}/')
-
-            # Create folder for SSH related files if specified.
-            if 'ssh' in package:
-                ssh_folder = f'{packages_path}/{package["id"]}/ssh/'
-                self._create_folder(ssh_folder)
-                for ssh_path in package['ssh']:
-                    try:
-                        file_name = ssh_path.split('/')[-1]
-                        shutil.copyfile(ssh_path, ssh_folder + file_name)
-                    except FileNotFoundError:
-                        print(f'SSH file "{ssh_path}" was not found.')
-                        sys.exit(1)
-
-            if 'files' in package:
-
-                # Create folder for files if specified.
-                files_folder = f'{packages_path}/{package["id"]}/files/'
-                self._create_folder(files_folder)
-
-                if 'volumes' in package:
-                    volumes = package["volumes"]
-                else:
-                    volumes = []
-
-                for file_path in package['files']:
-
-                    try:
-                        external_file_path, internal_file_path = file_path.split(':')
-                    except ValueError:
-                        print(f'Invalid file declaration "{file_path}"')
-                        sys.exit(1)
-
-                    try:
-                        # Make a copy of the file
-                        file_name = external_file_path.strip().split('/')[-1]
-                        shutil.copyfile(external_file_path, files_folder + file_name)
-                    except FileNotFoundError as e:
-                        print(f'File "{external_file_path}" was not found.')
-                        sys.exit(1)
-
-                    # Create a volume for the copied file
-                    volumes.append(f"{files_folder + file_name}:{internal_file_path}")
-
-                package["volumes"] = volumes
-
-            # Render Dockerfile for each package
-            with open(f'{packages_path}/{package["id"]}/Dockerfile', 'w+') as out:
-                out.write(dockerfile_templater.render(package=package))
+            self.__render_package(package, packages_path, dockerfile_templater)
 
         # Open template of Docker Compose YAML file.
-        compose_yaml_template = resource_string(__name__, 'templates/docker_compose.j2').decode('utf-8')
-        compose_yaml_templater = Template(compose_yaml_template)
+        compose_yaml_templater = environment.get_template('docker_compose.j2')
 
         # Render final Docker Compose YAML file
+        # The rendered output is written as it is produced (instead of being first rendered as a whole).
+        # Services are also only stringified as they are rendered (each sequence is iterated once by the template).
         with open(self.output_file_path, 'w+') as output_file:
-            output_file.write(compose_yaml_templater.render(
+            compose_yaml_templater.stream(
                 areas=self.areas,
                 direct_volumes=self.direct_volumes,
                 labeled_volumes=self.labeled_volumes,
                 networks=self.networks,
-                stringified_global_images=[self.__stringify_service(image) for image in self.global_images],
-                stringified_images=[self.__stringify_service(image) for image in self.images],
-                stringified_packages=[self.__stringify_service(package) for package in self.packages],
-                stringified_robots=[self.__stringify_service_robot(robot) for robot in self.robots]
-            ))
+                stringified_global_images=(self.__stringify_service(image) for image in self.global_images),
+                stringified_images=(self.__stringify_service(image) for image in self.images),
+                stringified_packages=(self.__stringify_service(package) for package in self.packages),
+                stringified_robots=(self.__stringify_service_robot(robot) for robot in self.robots)
+            ).dump(output_file)
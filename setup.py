@@ -52,7 +52,7 @@ setuptools.setup(
     python_requires='>=3.6',
     install_requires=[
         'docopt',
-        'jinja2',
+        'jinja2>=3.0',
         'pyyaml'
     ],
     py_modules=['enlil'],
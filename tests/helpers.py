@@ -0,0 +1,79 @@
+# Enlil
+#
+# Copyright © 2021 Pedro Pereira, Rafael Arrais
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import io
+import os
+import unittest
+from types import MappingProxyType
+from unittest import mock
+
+import yaml
+
+from pipeline.loader.entity_loader import YAMLLoader
+from pipeline.loader.entities.robot import Robot
+
+# Path of the file declaring the entities shared by the tests.
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'entities.yml')
+
+
+def freeze(data):
+    """ Returns a read-only copy of YAML data (dictionaries become mapping proxies and lists become tuples).
+    """
+    if isinstance(data, dict):
+        return MappingProxyType({key: freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(freeze(value) for value in data)
+    return data
+
+
+# Entities shared by the tests, parsed only once (read-only so that no test can modify them).
+with open(FIXTURES_PATH, 'rb') as fixtures_file:
+    FIXTURES = freeze(yaml.load(fixtures_file, Loader=YAMLLoader))
+
+
+class SilentTestCase(unittest.TestCase):
+    """ Base class for tests of entities that print messages for invalid data.
+    """
+
+    def setUp(self):
+        """ Silence the messages printed for invalid data.
+        """
+        patcher = mock.patch('sys.stdout', new=io.StringIO())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class RobotsTestCase(SilentTestCase):
+    """ Base class for tests of entities that belong to a robot (with a ROS1 and a ROS2 robot to choose from).
+    """
+
+    robotic_area = FIXTURES['robotic_area']
+    robot_ros1_data = FIXTURES['robot_ros1']
+    robot_ros2_data = FIXTURES['robot_ros2']
+
+    @classmethod
+    def setUpClass(cls):
+        """ Load the robots shared by all tests only once (and not when the module is imported).
+        """
+        cls.robot_ros1 = Robot(cls.robot_ros1_data, cls.robotic_area)
+        cls.robot_ros2 = Robot(cls.robot_ros2_data, cls.robotic_area)
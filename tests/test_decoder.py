@@ -0,0 +1,59 @@
+# Enlil
+#
+# Copyright © 2021 Pedro Pereira, Rafael Arrais
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import unittest
+
+from pipeline.decoder.decoder import Decoder
+from pipeline.loader.entities.area import Area
+from pipeline.loader.entities.image import Image
+from pipeline.loader.entities.robot import Robot
+
+
+class TestDecoder(unittest.TestCase):
+
+    def test_decoding_shared_image(self):
+        """ Test if a same image used by multiple robots is decoded separately for each robot.
+        """
+        area = Area({'id': 'dummy_area', 'robots': ['dummy_robot_1', 'dummy_robot_2']})
+        robot_1 = Robot({'id': 'dummy_robot_1', 'ros': 'melodic:11311', 'images': ['dummy_image']}, area.yaml_data)
+        robot_2 = Robot({'id': 'dummy_robot_2', 'ros': 'melodic:11312', 'images': ['dummy_image']}, area.yaml_data)
+
+        # Both images are loaded from the same YAML data (and therefore share the same list of volumes).
+        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image', 'volumes': ['/dummy/{{ROBOT_ID}}:/dummy']}
+        image_1 = Image(yaml_data, robot_1)
+        image_2 = Image(yaml_data, robot_2)
+
+        Decoder(
+            {area.id: area},
+            {robot_1.id: robot_1, robot_2.id: robot_2},
+            {image_1.id: image_1, image_2.id: image_2},
+            {},
+            {}
+        )
+        self.assertEqual(image_1.yaml_data['volumes'], ['/dummy/dummy_robot_1:/dummy'])
+        self.assertEqual(image_2.yaml_data['volumes'], ['/dummy/dummy_robot_2:/dummy'])
+        self.assertEqual(yaml_data['volumes'], ['/dummy/{{ROBOT_ID}}:/dummy'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,10 +23,11 @@
 import unittest
 from unittest import mock
 
+from helpers import SilentTestCase
 from pipeline.loader.entities.area import Area
 
 
-class TestEntityArea(unittest.TestCase):
+class TestEntityArea(SilentTestCase):
 
     @mock.patch.object(Area, '_Area__parse_yaml_data')
     def test_parsing_area(self, mock):
@@ -37,53 +38,41 @@ class TestEntityArea(unittest.TestCase):
         mock.assert_called_once_with(yaml_data)
         self.assertEqual(area.yaml_data, yaml_data)
 
-    def test_loading_area_empty_data(self):
-        """ Test if execution is terminated if empty data is provided.
+    def test_validating_area(self):
+        """ Test if no error is reported if valid data is provided.
         """
-        with self.assertRaises(SystemExit) as exception:
-            Area({})
-        self.assertEqual(exception.exception.code, 1)
+        yaml_data = {'id': 'dummy_area', 'robots': ['dummy_robot']}
+        self.assertIsNone(Area._validate(yaml_data))
 
-    def test_loading_area_without_id(self):
-        """ Test if execution is terminated if provided data has no required field "id".
+    def test_validating_invalid_area(self):
+        """ Test if an error is reported if invalid data is provided.
         """
-        yaml_data = {'dummy': 'dummy'}
-        with self.assertRaises(SystemExit) as exception:
-            Area(yaml_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_area_invalid_id(self):
-        """ Test if execution is terminated if provided data has an empty "id" field.
-        """
-        yaml_data = {'id': ''}
-        with self.assertRaises(SystemExit) as exception:
-            Area(yaml_data)
-        self.assertEqual(exception.exception.code, 1)
+        invalid_yaml_data = {
+            'empty data': ({}, 'An area was declared with empty data'),
+            'no required field "id"': (
+                {'dummy': 'dummy'},
+                'An area was declared without required field "id"\nAn area was declared without required field "robots"'
+            ),
+            'empty "id" field': ({'id': '', 'robots': ['dummy_robot']}, 'An area was declared with an empty "id"'),
+            'no required field "robots"': ({'id': 'dummy_area'}, 'An area was declared without required field "robots"'),
+            'empty "robots" field': ({'id': 'dummy_area', 'robots': []}, 'Area "dummy_area" was declared without robots'),
+            'same robot declared multiple times': (
+                {'id': 'dummy_area', 'robots': ['dummy_robot', 'dummy_robot']},
+                'Robot "dummy_robot" was declared multiple times within area "dummy_area"'
+            )
+        }
+        for case, (yaml_data, error) in invalid_yaml_data.items():
+            with self.subTest(case):
+                self.assertEqual(Area._validate(yaml_data), error)
 
-    def test_loading_area_without_robots(self):
-        """ Test if execution is terminated if provided data has no required field "robots".
-        """
-        yaml_data = {'id': 'dummy_area'}
-        with self.assertRaises(SystemExit) as exception:
-            Area(yaml_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_empty_area(self):
-        """ Test if execution is terminated if provided data has an empty "robots" field.
+    def test_loading_invalid_area(self):
+        """ Test if execution is terminated if invalid data is provided.
         """
         yaml_data = {'id': 'dummy_area', 'robots': []}
         with self.assertRaises(SystemExit) as exception:
             Area(yaml_data)
         self.assertEqual(exception.exception.code, 1)
 
-    def test_loading_area_with_same_robots(self):
-        """ Test if execution is terminated if a same robot is declared multiple times within an area.
-        """
-        yaml_data = {'id': 'dummy_area', 'robots': ['dummy_robot', 'dummy_robot']}
-        with self.assertRaises(SystemExit) as exception:
-            Area(yaml_data)
-        self.assertEqual(exception.exception.code, 1)
-
 
 if __name__ == '__main__':
     unittest.main()
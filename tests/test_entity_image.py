@@ -21,41 +21,29 @@
 # THE SOFTWARE.
 
 import unittest
+from types import MappingProxyType
 from unittest import mock
 
-from pipeline.loader.entities.robot import Robot
+from helpers import RobotsTestCase
 from pipeline.loader.entities.image import Image
 
+# Minimal valid YAML data of an image (read-only, copied by each test before being used).
+BASE_IMAGE_YAML = MappingProxyType({'id': 'dummy_image', 'image': 'dummy_docker_image'})
 
-class TestEntityImage(unittest.TestCase):
+# Network of the test area and master ROS node container of the test ROS1 robot.
+AREA_NETWORK = 'dummy_area-network'
+ROS1_ROSCORE = 'roscore-dummy_ros1_robot'
 
-    __robotic_area = {
-        'id': 'dummy_area',
-        'robots': ['dummy_ros1_robot', 'dummy_ros2_robot']
-    }
 
-    __robot_ros1_data = {
-        'id': 'dummy_ros1_robot',
-        'ros': 'melodic:11311',
-        'images': ['dummy_image']
-    }
-
-    __robot_ros2_data = {
-        'id': 'dummy_ros2_robot',
-        'ros': 'foxy:42',
-        'images': ['dummy_image']
-    }
-
-    __robot_ros1 = Robot(__robot_ros1_data, __robotic_area)
-    __robot_ros2 = Robot(__robot_ros2_data, __robotic_area)
+class TestEntityImage(RobotsTestCase):
 
     @mock.patch.object(Image, '_Image__parse_yaml_data')
     def test_parsing_image(self, mock):
         """ Test if the same provided data is the one being parsed.
         """
         yaml_data = {'dummy': 'dummy'}
-        image = Image(yaml_data, self.__robot_ros1)
-        mock.assert_called_once_with(yaml_data, self.__robot_ros1)
+        image = Image(yaml_data, self.robot_ros1)
+        mock.assert_called_once_with(yaml_data, self.robot_ros1)
         self.assertEqual(image.yaml_data, yaml_data)
 
     def test_loading_image_without_id(self):
@@ -63,15 +51,15 @@ class TestEntityImage(unittest.TestCase):
         """
         yaml_data = {'dummy': 'dummy'}
         with self.assertRaises(SystemExit) as exception:
-            Image(yaml_data, self.__robot_ros1)
+            Image(yaml_data, self.robot_ros1)
         self.assertEqual(exception.exception.code, 1)
 
     def test_loading_image_invalid_id(self):
         """ Test if execution is terminated if provided data has an empty "id" field.
         """
-        yaml_data = {'id': ''}
+        yaml_data = {**BASE_IMAGE_YAML, 'id': ''}
         with self.assertRaises(SystemExit) as exception:
-            Image(yaml_data, self.__robot_ros1)
+            Image(yaml_data, self.robot_ros1)
         self.assertEqual(exception.exception.code, 1)
 
     def test_loading_image_without_docker_image(self):
@@ -79,29 +67,29 @@ class TestEntityImage(unittest.TestCase):
         """
         yaml_data = {'id': 'dummy_image'}
         with self.assertRaises(SystemExit) as exception:
-            Image(yaml_data, self.__robot_ros1)
+            Image(yaml_data, self.robot_ros1)
         self.assertEqual(exception.exception.code, 1)
 
     def test_loading_image_ros1_id(self):
         """ Test if field "id" is properly set for ROS1 images.
         """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
+        yaml_data = dict(BASE_IMAGE_YAML)
         image_id = yaml_data['id']
-        image = Image(yaml_data, self.__robot_ros1)
-        self.assertEqual(image.yaml_data['id'], f"{self.__robot_ros1.id}-{image_id}")
+        image = Image(yaml_data, self.robot_ros1)
+        self.assertEqual(image.yaml_data['id'], f"{self.robot_ros1.id}-{image_id}")
 
     def test_loading_image_ros2_id(self):
         """ Test if field "id" is properly set for ROS2 images.
         """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
+        yaml_data = dict(BASE_IMAGE_YAML)
         image_id = yaml_data['id']
-        image = Image(yaml_data, self.__robot_ros2)
-        self.assertEqual(image.yaml_data['id'], f"{self.__robot_ros2.id}-{image_id}")
+        image = Image(yaml_data, self.robot_ros2)
+        self.assertEqual(image.yaml_data['id'], f"{self.robot_ros2.id}-{image_id}")
 
     def test_loading_gobal_image_id(self):
         """ Test if field "id" is properly set for global images.
         """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
+        yaml_data = dict(BASE_IMAGE_YAML)
         image_id = yaml_data['id']
         image = Image(yaml_data, None)
         self.assertEqual(image.yaml_data['id'], f'{image_id}')
@@ -109,14 +97,14 @@ class TestEntityImage(unittest.TestCase):
     def test_loading_image_default_docker_image_tag(self):
         """ Test if default tag is properly set.
         """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, self.__robot_ros1)
+        yaml_data = dict(BASE_IMAGE_YAML)
+        image = Image(yaml_data, self.robot_ros1)
         self.assertEqual(image.yaml_data['tag'], '{{ROBOT_ROS_DISTRO}}')
 
     def test_loading_global_image_default_docker_image_tag(self):
         """ Test if default tag is properly set for global images.
         """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
+        yaml_data = dict(BASE_IMAGE_YAML)
         image = Image(yaml_data, None)
         self.assertEqual(image.yaml_data['tag'], 'latest')
 
@@ -125,119 +113,111 @@ class TestEntityImage(unittest.TestCase):
         """
         yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image:dummy_tagas'}
         tag = yaml_data['image'].split(':')[-1]
-        image = Image(yaml_data, self.__robot_ros1)
+        image = Image(yaml_data, self.robot_ros1)
         self.assertEqual(image.yaml_data['tag'], tag)
 
-    def test_loading_image_ros1_environment_variables(self):
-        """ Test if default environment variables are set properly for ROS1 images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, self.__robot_ros1)
-        self.assertEqual(len(image.yaml_data['environment']), 2)
-        self.assertTrue(f"ROS_HOSTNAME={yaml_data['id']}" in image.yaml_data['environment'])
-        self.assertTrue('ROS_MASTER_URI=http://roscore-{{ROBOT_ID}}:{{ROBOT_ROS_PORT}}' in image.yaml_data['environment'])
-
-    def test_loading_image_ros2_environment_variables(self):
-        """ Test if default environment variables are set properly for ROS2 images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, self.__robot_ros2)
-        self.assertEqual(len(image.yaml_data['environment']), 1)
-        self.assertTrue('ROS_DOMAIN_ID={{ROBOT_ROS_DOMAIN}}' in image.yaml_data['environment'])
-
-    def test_loading_global_image_no_environment_variables(self):
-        """ Test if no environment variables are set by default for global images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, None)
-        self.assertEqual(len(image.yaml_data['environment']), 0)
-
-    def test_loading_image_ros1_networks(self):
-        """ Test if default networks are properly set for ROS1 images.
+    def test_loading_image_registry_docker_image_tag(self):
+        """ Test if tag is properly set for images of a registry with a port.
         """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, self.__robot_ros1)
-        self.assertEqual(len(image.yaml_data['networks']), 1)
-        self.assertTrue(f"{self.__robotic_area['id']}-network" in image.yaml_data['networks'])
+        yaml_data = {'id': 'dummy_image', 'image': 'dummy_registry:5000/dummy_docker_image:dummy_tag'}
+        image = Image(yaml_data, self.robot_ros1)
+        self.assertEqual(image.yaml_data['image'], 'dummy_registry:5000/dummy_docker_image')
+        self.assertEqual(image.yaml_data['tag'], 'dummy_tag')
 
-    def test_loading_image_ros2_networks(self):
-        """ Test if default networks are properly set for ROS2 images.
+    def test_loading_image_registry_default_docker_image_tag(self):
+        """ Test if default tag is properly set for images of a registry with a port.
         """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, self.__robot_ros2)
-        self.assertEqual(len(image.yaml_data['networks']), 1)
-        self.assertTrue(f"{self.__robotic_area['id']}-network" in image.yaml_data['networks'])
-
-    def test_loading_global_image_no_networks(self):
-        """ Test if no default networks are set for global images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, None)
-        self.assertTrue('networks' not in image.yaml_data)
-
-    def test_loading_image_ros1_depends_on(self):
-        """ Test if field "depends_on" is properly set for ROS1 images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, self.__robot_ros1)
-        self.assertEqual(len(image.yaml_data['depends_on']), 1)
-        self.assertTrue(f"roscore-{self.__robot_ros1.yaml_data['id']}" in image.yaml_data['depends_on'])
-
-    def test_loading_image_ros2_depends_on(self):
-        """ Test if field "depends_on" is not set for ROS2 images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, self.__robot_ros2)
-        self.assertEqual(len(image.yaml_data['depends_on']), 0)
-
-    def test_loading_global_image_no_depends_on(self):
-        """ Test if field "depends_on" is not set for global images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, None)
-        self.assertTrue('depends_on' not in image.yaml_data)
-
-    def test_loading_image_ros1_restart_default(self):
-        """ Test if field "restart" is properly set to default for ROS1 images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, self.__robot_ros1)
-        self.assertEqual(image.yaml_data['restart'], 'always')
-
-    def test_loading_image_ros1_restart(self):
-        """ Test if field "restart" is properly set when specified for ROS1 images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image', 'restart': 'dummy'}
-        image = Image(yaml_data, self.__robot_ros1)
-        self.assertEqual(image.yaml_data['restart'], yaml_data['restart'])
-
-    def test_loading_image_ros2_restart_default(self):
-        """ Test if field "restart" is properly set to default for ROS2 images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, self.__robot_ros2)
-        self.assertEqual(image.yaml_data['restart'], 'always')
-
-    def test_loading_image_ros2_restart(self):
-        """ Test if field "restart" is properly set when specified for ROS1 images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image', 'restart': 'dummy'}
-        image = Image(yaml_data, self.__robot_ros2)
-        self.assertEqual(image.yaml_data['restart'], yaml_data['restart'])
-
-    def test_loading_global_image_restart_default(self):
-        """ Test if field "restart" is properly set to default for global images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image'}
-        image = Image(yaml_data, None)
-        self.assertEqual(image.yaml_data['restart'], 'always')
+        yaml_data = {'id': 'dummy_image', 'image': 'dummy_registry:5000/dummy_docker_image'}
+        image = Image(yaml_data, self.robot_ros1)
+        self.assertEqual(image.yaml_data['image'], yaml_data['image'])
+        self.assertEqual(image.yaml_data['tag'], '{{ROBOT_ROS_DISTRO}}')
 
-    def test_loading_global_image_restart(self):
-        """ Test if field "restart" is properly set when specified for global images.
-        """
-        yaml_data = {'id': 'dummy_image', 'image': 'dummy_docker_image', 'restart': 'dummy'}
-        image = Image(yaml_data, None)
-        self.assertEqual(image.yaml_data['restart'], yaml_data['restart'])
+    def test_loading_image_multiple_robots(self):
+        """ Test if a same image can be loaded for multiple robots without modifying the provided data.
+        """
+        yaml_data = dict(BASE_IMAGE_YAML)
+        image_ros1 = Image(yaml_data, self.robot_ros1)
+        image_ros2 = Image(yaml_data, self.robot_ros2)
+        self.assertEqual(yaml_data, BASE_IMAGE_YAML)
+        self.assertEqual(image_ros1.yaml_data['id'], f"{self.robot_ros1_data['id']}-{yaml_data['id']}")
+        self.assertEqual(image_ros2.yaml_data['id'], f"{self.robot_ros2_data['id']}-{yaml_data['id']}")
+        self.assertEqual(len(image_ros2.yaml_data['environment']), 1)
+
+    def test_loading_image_declared_environment_variables(self):
+        """ Test if declared environment variables are kept without modifying the provided data.
+        """
+        yaml_data = {**BASE_IMAGE_YAML, 'environment': ['DUMMY=dummy']}
+        image = Image(yaml_data, self.robot_ros1)
+        image.yaml_data['environment'].append('OTHER_DUMMY=dummy')
+        self.assertEqual(yaml_data['environment'], ['DUMMY=dummy'])
+        self.assertEqual(image.yaml_data['environment'][0], 'DUMMY=dummy')
+        self.assertEqual(len(Image(yaml_data, self.robot_ros1).yaml_data['environment']), 3)
+
+    def __robots(self):
+        """ Returns the robot passed to each kind of image (global images are passed no robot).
+        """
+        return {'ROS1': self.robot_ros1, 'ROS2': self.robot_ros2, 'global': None}
+
+    def test_loading_image_environment_variables(self):
+        """ Test if default environment variables are properly set for ROS1, ROS2 and global images.
+        """
+        expected_environment = {
+            'ROS1': ['ROS_HOSTNAME={}', 'ROS_MASTER_URI=http://roscore-{{ROBOT_ID}}:{{ROBOT_ROS_PORT}}'],
+            'ROS2': ['ROS_DOMAIN_ID={{ROBOT_ROS_DOMAIN}}'],
+            'global': []
+        }
+        for kind, robot in self.__robots().items():
+            with self.subTest(kind):
+                yaml_data = dict(BASE_IMAGE_YAML)
+                image = Image(yaml_data, robot)
+                environment = [variable.replace('{}', image.id) for variable in expected_environment[kind]]
+                self.assertEqual(image.yaml_data['environment'], environment)
+
+    def test_loading_image_networks(self):
+        """ Test if default networks are properly set for ROS1 and ROS2 images but not for global images.
+        """
+        expected_networks = {
+            'ROS1': [AREA_NETWORK],
+            'ROS2': [AREA_NETWORK],
+            'global': None
+        }
+        for kind, robot in self.__robots().items():
+            with self.subTest(kind):
+                yaml_data = dict(BASE_IMAGE_YAML)
+                image = Image(yaml_data, robot)
+                self.assertEqual(image.yaml_data.get('networks'), expected_networks[kind])
+
+    def test_loading_image_depends_on(self):
+        """ Test if field "depends_on" is properly set for ROS1 images but not for ROS2 and global images.
+        """
+        expected_depends_on = {
+            'ROS1': [ROS1_ROSCORE],
+            'ROS2': [],
+            'global': None
+        }
+        for kind, robot in self.__robots().items():
+            with self.subTest(kind):
+                yaml_data = dict(BASE_IMAGE_YAML)
+                image = Image(yaml_data, robot)
+                self.assertEqual(image.yaml_data.get('depends_on'), expected_depends_on[kind])
+
+    def test_loading_image_restart_default(self):
+        """ Test if field "restart" is properly set to default for ROS1, ROS2 and global images.
+        """
+        for kind, robot in self.__robots().items():
+            with self.subTest(kind):
+                yaml_data = dict(BASE_IMAGE_YAML)
+                image = Image(yaml_data, robot)
+                self.assertEqual(image.yaml_data['restart'], 'always')
+
+    def test_loading_image_restart(self):
+        """ Test if field "restart" is properly set when specified for ROS1, ROS2 and global images.
+        """
+        for kind, robot in self.__robots().items():
+            with self.subTest(kind):
+                yaml_data = {**BASE_IMAGE_YAML, 'restart': 'dummy'}
+                image = Image(yaml_data, robot)
+                self.assertEqual(image.yaml_data['restart'], yaml_data['restart'])
 
 
 if __name__ == '__main__':
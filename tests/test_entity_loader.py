@@ -0,0 +1,148 @@
+# Enlil
+#
+# Copyright © 2021 Pedro Pereira, Rafael Arrais
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import yaml
+
+from helpers import SilentTestCase
+from pipeline.loader.entity_loader import EntityLoader
+
+
+class TestEntityLoader(SilentTestCase):
+
+    def setUp(self):
+        """ Create a temporary folder for the configuration files of each test.
+        """
+        super().setUp()
+        temporary_folder = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_folder.cleanup)
+        self.__configuration_file_path = os.path.join(temporary_folder.name, 'configuration.yml')
+
+    def __load(self, areas, robots, images=None, packages=None):
+        """ Write a configuration file declaring the given entities and load it.
+        """
+        yaml_data = {'areas': areas, 'robots': robots}
+        if images is not None:
+            yaml_data['images'] = images
+        if packages is not None:
+            yaml_data['packages'] = packages
+        with open(self.__configuration_file_path, 'w') as configuration_file:
+            yaml.safe_dump(yaml_data, configuration_file)
+        return EntityLoader(self.__configuration_file_path)
+
+    def __assert_exits(self, message, *args):
+        """ Test if loading the given entities terminates execution with the given message.
+        """
+        with mock.patch('sys.stdout', new=io.StringIO()) as output:
+            with self.assertRaises(SystemExit) as exception:
+                self.__load(*args)
+        self.assertEqual(exception.exception.code, 1)
+        self.assertEqual(output.getvalue(), message)
+
+    def test_loading_entities(self):
+        """ Test if all entities are loaded and referenced by their unique "id".
+        """
+        loader = self.__load(
+            [{'id': 'dummy_area', 'robots': ['dummy_robot']}],
+            [{'id': 'dummy_robot', 'ros': 'melodic', 'images': ['dummy_image'], 'packages': ['dummy_package']}],
+            [{'id': 'dummy_image', 'image': 'dummy_docker_image'}],
+            [{'id': 'dummy_package', 'path': 'dummy_path', 'command': 'dummy_command', 'apt': ['dummy_apt']}]
+        )
+        self.assertEqual(list(loader.areas), ['dummy_area'])
+        self.assertEqual(list(loader.robots), ['dummy_robot'])
+        self.assertEqual(list(loader.images), ['dummy_robot-dummy_image'])
+        self.assertEqual(list(loader.packages), ['dummy_robot-dummy_package'])
+
+    def test_loading_entities_listing_order(self):
+        """ Test if images and packages are loaded in the order they are listed by their robot.
+        """
+        loader = self.__load(
+            [{'id': 'dummy_area', 'robots': ['dummy_robot']}],
+            [{'id': 'dummy_robot', 'ros': 'melodic', 'images': ['dummy_image_2', 'dummy_image_1']}],
+            [{'id': 'dummy_image_1', 'image': 'dummy_docker_image'}, {'id': 'dummy_image_2', 'image': 'dummy_docker_image'}]
+        )
+        self.assertEqual(list(loader.images), ['dummy_robot-dummy_image_2', 'dummy_robot-dummy_image_1'])
+
+    def test_loading_unused_entities_same_id(self):
+        """ Test if execution is terminated if multiple entities share the same "id" (even if not used by any robot).
+        """
+        self.__assert_exits(
+            'Found multiple images with same id "unused_image"\n',
+            [{'id': 'dummy_area', 'robots': ['dummy_robot']}],
+            [{'id': 'dummy_robot', 'ros': 'melodic', 'images': ['dummy_image']}],
+            [
+                {'id': 'dummy_image', 'image': 'dummy_docker_image'},
+                {'id': 'unused_image', 'image': 'dummy_docker_image'},
+                {'id': 'unused_image', 'image': 'dummy_docker_image'}
+            ]
+        )
+
+    def test_loading_entities_without_id(self):
+        """ Test if execution is terminated if an entity has no "id" or an empty "id" (reported separately).
+        """
+        areas = [{'id': 'dummy_area', 'robots': ['dummy_robot']}]
+        robots = [{'id': 'dummy_robot', 'ros': 'melodic', 'images': ['dummy_image']}]
+        invalid_images = {
+            'no "id" field': ([{'image': 'dummy_docker_image'}], 'An image was declared without required field "id" .\n'),
+            'empty "id" field': ([{'id': '', 'image': 'dummy_docker_image'}], 'An image was declared with an empty "id"\n')
+        }
+        for case, (images, message) in invalid_images.items():
+            with self.subTest(case):
+                self.__assert_exits(message, areas, robots, images)
+
+    def test_loading_undeclared_references(self):
+        """ Test if execution is terminated if undeclared images or packages are listed (all reported at once).
+        """
+        self.__assert_exits(
+            'Image "missing_image" was listed but not declared.\n'
+            'Package "missing_package" was listed but not declared.\n'
+            'Image "other_missing_image" was listed but not declared.\n',
+            [{'id': 'dummy_area', 'robots': ['dummy_robot_1', 'dummy_robot_2']}],
+            [
+                {
+                    'id': 'dummy_robot_1', 'ros': 'melodic:11311',
+                    'images': ['dummy_image', 'missing_image'], 'packages': ['missing_package']
+                },
+                {'id': 'dummy_robot_2', 'ros': 'melodic:11312', 'images': ['other_missing_image']}
+            ],
+            [{'id': 'dummy_image', 'image': 'dummy_docker_image'}]
+        )
+
+    def test_loading_undeclared_robot(self):
+        """ Test if execution is terminated if an undeclared robot is listed within an area.
+        """
+        self.__assert_exits(
+            'Robot "missing_robot" was listed but not declared.\n',
+            [{'id': 'dummy_area', 'robots': ['missing_robot']}],
+            [{'id': 'dummy_robot', 'ros': 'melodic', 'images': ['dummy_image']}],
+            [{'id': 'dummy_image', 'image': 'dummy_docker_image'}]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
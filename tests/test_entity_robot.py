@@ -23,10 +23,11 @@
 import unittest
 from unittest import mock
 
+from helpers import SilentTestCase
 from pipeline.loader.entities.robot import Robot
 
 
-class TestEntityRobot(unittest.TestCase):
+class TestEntityRobot(SilentTestCase):
 
     __area_data = {'id': 'dummy_area'}
 
@@ -36,56 +37,34 @@ class TestEntityRobot(unittest.TestCase):
         """
         yaml_data = {'dummy': 'dummy'}
         robot = Robot(yaml_data, self.__area_data)
-        mock.assert_called_once_with(yaml_data)
-        self.assertEqual(robot.yaml_data, yaml_data)
-
-    def test_loading_robot_without_id(self):
-        """ Test if execution is terminated if provided data has no required field "id".
-        """
-        yaml_data = {'dummy': 'dummy'}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_robot_invalid_id(self):
-        """ Test if execution is terminated if provided data has an empty "id" field.
-        """
-        yaml_data = {'id': ''}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_robot_without_ros(self):
-        """ Test if execution is terminated if provided data has no required field "ros".
-        """
-        yaml_data = {'id': 'dummy_robot'}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_robot_invalid_distro(self):
-        """ Test if execution is terminated if an invalid ROS distribuiton is specified.
-        """
-        yaml_data = {'id': 'dummy_robot', 'ros': 'unknown'}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_robot_ros1_no_port(self):
-        """ Test if execution is terminated if no port is specified for a ROS1 robot.
-        """
-        yaml_data = {'id': 'dummy_robot', 'ros': 'melodic:'}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_robot_ros1_invalid_port(self):
-        """ Test if execution is terminated if an invalid port is specified for a ROS1 robot.
-        """
-        yaml_data = {'id': 'dummy_robot', 'ros': 'melodic:port'}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
+        expected_yaml_data = {'dummy': 'dummy', 'area': self.__area_data['id']}
+        mock.assert_called_once_with(expected_yaml_data)
+        self.assertEqual(robot.yaml_data, expected_yaml_data)
+
+    def test_loading_invalid_robot(self):
+        """ Test if execution is terminated if invalid data is provided.
+        """
+        invalid_yaml_data = {
+            'no required field "id"': {'dummy': 'dummy'},
+            'empty "id" field': {'id': '', 'ros': 'melodic', 'packages': ['dummy_package']},
+            'no required field "ros"': {'id': 'dummy_robot'},
+            'invalid ROS distribution': {'id': 'dummy_robot', 'ros': 'unknown'},
+            'ROS1 robot without port': {'id': 'dummy_robot', 'ros': 'melodic:'},
+            'ROS1 robot with an invalid port': {'id': 'dummy_robot', 'ros': 'melodic:port'},
+            'ROS1 robot with a negative port': {'id': 'dummy_robot', 'ros': 'melodic:-11311'},
+            'ROS2 robot without domain': {'id': 'dummy_robot', 'ros': 'foxy:'},
+            'ROS2 robot with an invalid domain': {'id': 'dummy_robot', 'ros': 'foxy:domain'},
+            'no images or packages': {'id': 'dummy_robot', 'ros': 'melodic:11311'},
+            'empty image "id"': {'id': 'dummy_robot', 'ros': 'melodic:11311', 'images': ['dummy_image', '']},
+            'same image declared multiple times': {'id': 'dummy_robot', 'ros': 'melodic:11311', 'images': ['dummy_image', 'dummy_image']},
+            'empty package "id"': {'id': 'dummy_robot', 'ros': 'melodic:11311', 'packages': ['dummy_package', '']},
+            'same package declared multiple times': {'id': 'dummy_robot', 'ros': 'melodic:11311', 'packages': ['dummy_package', 'dummy_package']}
+        }
+        for case, yaml_data in invalid_yaml_data.items():
+            with self.subTest(case):
+                with self.assertRaises(SystemExit) as exception:
+                    Robot(yaml_data, self.__area_data)
+                self.assertEqual(exception.exception.code, 1)
 
     def test_loading_robot_ros1_port(self):
         """ Test if port for a ROS1 robot is properly sey when specified.
@@ -95,6 +74,15 @@ class TestEntityRobot(unittest.TestCase):
         robot_port = int(yaml_data['ros'].split(':')[-1])
         self.assertEqual(robot.yaml_data['ros_metadata'], robot_port)
 
+    def test_loading_robot_ros1_port_formatting(self):
+        """ Test if port for a ROS1 robot is properly set when specified with whitespaces or a plus sign.
+        """
+        for ros in ['melodic: 13342', 'melodic:13342 ', 'melodic:+13342']:
+            with self.subTest(ros):
+                yaml_data = {'id': 'dummy_robot', 'ros': ros, 'packages': ['dummy_package']}
+                robot = Robot(yaml_data, self.__area_data)
+                self.assertEqual(robot.yaml_data['ros_metadata'], 13342)
+
     def test_loading_robot_ros1_default_port(self):
         """ Test if port for a ROS1 robot is properly sey when specified.
         """
@@ -102,22 +90,6 @@ class TestEntityRobot(unittest.TestCase):
         robot = Robot(yaml_data, self.__area_data)
         self.assertEqual(robot.yaml_data['ros_metadata'], 11311)
 
-    def test_loading_robot_ros2_no_domain(self):
-        """ Test if execution is terminated if no domain is specified for a ROS2 robot.
-        """
-        yaml_data = {'id': 'dummy_robot', 'ros': 'foxy:'}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_robot_ros2_invalid_domain(self):
-        """ Test if execution is terminated if an invalid somain is specified for a ROS2 robot.
-        """
-        yaml_data = {'id': 'dummy_robot', 'ros': 'foxy:domain'}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
     def test_loading_robot_ros2_domain(self):
         """ Test if domain for a ROS2 robot is properly set when specified.
         """
@@ -133,46 +105,6 @@ class TestEntityRobot(unittest.TestCase):
         robot = Robot(yaml_data, self.__area_data)
         self.assertEqual(robot.yaml_data['ros_metadata'], 42)
 
-    def test_loading_robot_empty(self):
-        """ Test if execution is terminated if a robot is specified without images or packages.
-        """
-        yaml_data = {'id': 'dummy_robot', 'ros': 'melodic:11311'}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_robot_empty_image(self):
-        """ Test if execution is terminated if a robot is specified with an empty image "id".
-        """
-        yaml_data = {'id': 'dummy_robot', 'ros': 'melodic:11311', 'images': ['dummy_image', '']}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_robot_multiple_images(self):
-        """ Test if execution is terminated if an image is declared multiple times within a robot.
-        """
-        yaml_data = {'id': 'dummy_robot', 'ros': 'melodic:11311', 'images': ['dummy_image', 'dummy_image']}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_robot_empty_package(self):
-        """ Test if execution is terminated if a robot is specified with an empty package "id".
-        """
-        yaml_data = {'id': 'dummy_robot', 'ros': 'melodic:11311', 'packages': ['dummy_package', '']}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
-    def test_loading_robot_multiple_packages(self):
-        """ Test if execution is terminated if a package is declared multiple times within a robot.
-        """
-        yaml_data = {'id': 'dummy_robot', 'ros': 'melodic:11311', 'packages': ['dummy_package', 'dummy_package']}
-        with self.assertRaises(SystemExit) as exception:
-            Robot(yaml_data, self.__area_data)
-        self.assertEqual(exception.exception.code, 1)
-
     def test_loading_robot_default_restart(self):
         """ Test if a default value for "restart" is properly set.
         """
@@ -264,6 +196,24 @@ class TestEntityRobot(unittest.TestCase):
         self.assertEqual(len(robot.yaml_data['networks']), 1)
         self.assertEqual(robot.yaml_data['networks'][0], f"{self.__area_data['id']}-network")
 
+    def test_loading_robot_ros1_roscore(self):
+        """ Test if the name of the master ROS node container is properly set for ROS1 robots.
+        """
+        yaml_data = {'id': 'dummy_robot', 'ros': 'melodic', 'packages': ['dummy_package']}
+        robot = Robot(yaml_data, self.__area_data)
+
+        self.assertEqual(robot.network, f"{self.__area_data['id']}-network")
+        self.assertEqual(robot.roscore, f"roscore-{yaml_data['id']}")
+
+    def test_loading_robot_ros2_roscore(self):
+        """ Test if no master ROS node container is set for ROS2 robots.
+        """
+        yaml_data = {'id': 'dummy_robot', 'ros': 'foxy', 'packages': ['dummy_package']}
+        robot = Robot(yaml_data, self.__area_data)
+
+        self.assertEqual(robot.network, f"{self.__area_data['id']}-network")
+        self.assertIsNone(robot.roscore)
+
 
 if __name__ == '__main__':
     unittest.main()